@@ -3,7 +3,6 @@
 from .config import load_effective_config
 from .config_model import Config
 from .exceptions import CliUsageError, ConfigError, GaiError, GenerationError, TemplateError
-from .generation import generate, prepare_generate_content_config_dict, prepare_prompt_contents
 from .templates import render_template_string
 
 __version__ = "0.1.9"
@@ -22,3 +21,15 @@ __all__ = [
     "prepare_prompt_contents",
     "render_template_string",
 ]
+
+# The generation helpers need google-genai, which dominates import time; load
+# them on first access so config, template and help commands never import it
+_GENERATION_EXPORTS = frozenset({"generate", "prepare_generate_content_config_dict", "prepare_prompt_contents"})
+
+
+def __getattr__(name: str):
+    if name in _GENERATION_EXPORTS:
+        from . import generation
+
+        return getattr(generation, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
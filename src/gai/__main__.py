@@ -18,7 +18,6 @@ from .cli import (
 )
 from .config import CONFIG_FILE_DIR, load_effective_config
 from .exceptions import CliUsageError, ConfigError, GaiError, GenerationError, TemplateError
-from .generation import generate
 
 
 def _has_cli_override(args_list: list[str], name: str) -> bool:
@@ -125,6 +124,9 @@ def _handle_new_cli(args_list: list[str]) -> None:
         if parsed.show_prompt:
             show_rendered_prompt(effective_config, template_vars)
         else:
+            # Imported here so commands that never call the API skip loading google-genai
+            from .generation import generate
+
             generate(
                 effective_config,
                 template_vars,
@@ -139,10 +141,16 @@ def _handle_new_cli(args_list: list[str]) -> None:
         sys.exit(1)
 
 
-def main() -> None:
-    """Main execution function."""
+def main(argv: list[str] | None = None) -> None:
+    """Main execution function.
+
+    Args:
+        argv: Command-line arguments without the program name (defaults to sys.argv[1:])
+    """
+    args_list = list(sys.argv[1:] if argv is None else argv)
+
     # Configure logging once, early in the process
-    log_level = logging.DEBUG if "--debug" in sys.argv else logging.WARNING
+    log_level = logging.DEBUG if "--debug" in args_list else logging.WARNING
     logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s - %(message)s", stream=sys.stderr)
 
     logger = logging.getLogger(__name__)
@@ -153,8 +161,6 @@ def main() -> None:
     except OSError as e:
         logger.warning(f"Could not create config directory {CONFIG_FILE_DIR}: {e}")
 
-    args_list = list(sys.argv[1:])
-
     try:
         _handle_new_cli(args_list)
 
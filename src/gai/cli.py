@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 if TYPE_CHECKING:
-    from .template_catalog import TemplateRecord
+    from .template_catalog import TemplateCatalog, TemplateRecord
 
 from .config import (
     CONFIG_FILE_DIR,
@@ -161,6 +161,12 @@ def create_parser() -> argparse.ArgumentParser:
     render_parser = template_subparsers.add_parser(
         "render",
         help="Render prompt template with variables",
+        usage="%(prog)s [options] [template_name] [--VARIABLE VALUE ...]",
+        description=(
+            "positional arguments:\n"
+            "  template_name  Optional user instruction template logical name (shorthand for\n"
+            "                 -t/--template), given before any template variable"
+        ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -171,11 +177,10 @@ def create_parser() -> argparse.ArgumentParser:
         default="both",
         help="Which part to render (default: both)",
     )
-    render_parser.add_argument(
-        "template_name",
-        nargs="?",
-        help="Optional user instruction template logical name (shorthand for -t/--template)",
-    )
+    # template_name is not declared as an argparse positional: template variables are
+    # unknown options to argparse, which would hand the value of the first one to the
+    # positional. parse_args_for_new_cli reads it from the leftover arguments instead.
+    render_parser.set_defaults(template_name=None)
     render_parser.add_argument(
         "-t",
         "--template",
@@ -278,6 +283,10 @@ def parse_args_for_new_cli(args: list[str]) -> tuple[argparse.Namespace, dict[st
     # First pass: parse known args to get command structure and config
     parsed, remaining = parser.parse_known_args(args)
 
+    # 'template render' takes an optional template name ahead of its variables
+    if getattr(parsed, "template_command", None) == "render" and remaining and not remaining[0].startswith("--"):
+        parsed.template_name = remaining.pop(0)
+
     # Parse template variables from remaining args
     template_vars = parse_template_args_from_list(remaining)
 
@@ -418,6 +427,21 @@ def handle_config_path() -> None:
 # ===== Template subcommand handlers =====
 
 
+def _filter_records(catalog: "TemplateCatalog", parsed: argparse.Namespace) -> list["TemplateRecord"]:
+    """Apply the --tier and --filter options of list/browse to the catalog.
+
+    The tier filter reads the catalog's per-tier partition instead of scanning every
+    record; the case-sensitive substring filter then runs over what is left.
+    """
+    tier = getattr(parsed, "tier", None)
+    records = catalog.filter_by_tier(tier) if tier else list(catalog.records)
+
+    substring = getattr(parsed, "filter", None)
+    if substring:
+        records = [r for r in records if substring in r.logical_name_full]
+    return records
+
+
 def handle_template_list(config: dict[str, Any], parsed: argparse.Namespace) -> None:
     """Handle the 'gai template list' command.
 
@@ -434,16 +458,7 @@ def handle_template_list(config: dict[str, Any], parsed: argparse.Namespace) ->
 
     # Build catalog from configuration
     catalog = build_template_catalog(config)
-    records = list(catalog.records)
-
-    # Apply tier filter if specified
-    if hasattr(parsed, "tier") and parsed.tier:
-        records = [r for r in records if r.tier == parsed.tier]
-
-    # Apply substring filter if specified
-    if hasattr(parsed, "filter") and parsed.filter:
-        substring = parsed.filter
-        records = [r for r in records if substring in r.logical_name_full]
+    records = _filter_records(catalog, parsed)
 
     # Handle empty results
     if not records:
@@ -514,12 +529,10 @@ def handle_template_list(config: dict[str, Any], parsed: argparse.Namespace) ->
             for i, cell in enumerate(row):
                 col_widths[i] = max(col_widths[i], len(str(cell)))
 
-        header_line = "  ".join(h.ljust(col_widths[i]) for i, h in enumerate(header))
-        print(header_line)
-
-        for row in rows:
-            row_line = "  ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-            print(row_line)
+        # Assemble the whole table and write it at once rather than a print per row
+        lines = ["  ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row)) for row in [header, *rows]]
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 def handle_template_browse(config: dict[str, Any], parsed: argparse.Namespace) -> None:
@@ -538,16 +551,7 @@ def handle_template_browse(config: dict[str, Any], parsed: argparse.Namespace) -
 
     # Build catalog from configuration
     catalog = build_template_catalog(config)
-    records = list(catalog.records)
-
-    # Apply tier filter if specified
-    if hasattr(parsed, "tier") and parsed.tier:
-        records = [r for r in records if r.tier == parsed.tier]
-
-    # Apply substring filter if specified
-    if hasattr(parsed, "filter") and parsed.filter:
-        substring = parsed.filter
-        records = [r for r in records if substring in r.logical_name_full]
+    records = _filter_records(catalog, parsed)
 
     # Handle empty results
     if not records:
@@ -632,6 +636,18 @@ def _print_outputs_section(outputs: set[str]) -> None:
         print(f"  {name}")
 
 
+# fzf command line for template selection
+_FZF_BASE_ARGS = (
+    "fzf",
+    "--delimiter",
+    "\t",
+    "--with-nth",
+    "1,2,3",  # Show first three columns (logical_name, tier, relative_path)
+)
+# Use the 4th field (absolute_path) for preview
+_FZF_PREVIEW_ARGS = ("--preview", "cat {4}", "--preview-window", "right:60%:wrap")
+
+
 def _run_fzf_selection(
     records: list["TemplateRecord"],
     *,
@@ -666,25 +682,7 @@ def _run_fzf_selection(
 
     input_text = "\n".join(lines)
 
-    # Build fzf command
-    fzf_args = [
-        "fzf",
-        "--delimiter",
-        "\t",
-        "--with-nth",
-        "1,2,3",  # Show first three columns (logical_name, tier, relative_path)
-    ]
-
-    if preview_enabled:
-        # Use the 4th field (absolute_path) for preview
-        fzf_args.extend(
-            [
-                "--preview",
-                "cat {4}",
-                "--preview-window",
-                "right:60%:wrap",
-            ]
-        )
+    fzf_args = [*_FZF_BASE_ARGS, *_FZF_PREVIEW_ARGS] if preview_enabled else list(_FZF_BASE_ARGS)
 
     # Run fzf
     try:
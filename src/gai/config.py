@@ -1,7 +1,12 @@
 """Configuration management for gai."""
 
+import functools
 import logging
+import os
 import pathlib
+import sys
+import time
+from types import MappingProxyType
 from typing import Any, Optional
 
 try:
@@ -58,6 +63,9 @@ CONFIG_TYPES: dict[str, type] = {
     "user-instruction-template": str,
 }
 
+# Configuration keys holding template root paths, in tier precedence order
+TEMPLATE_PATH_KEYS = ("project-template-paths", "user-template-paths", "builtin-template-paths")
+
 # User-level configuration file path
 CONFIG_FILE_DIR = pathlib.Path.home() / ".config" / "gai"
 CONFIG_FILE_PATH = CONFIG_FILE_DIR / "config.toml"
@@ -95,18 +103,16 @@ def load_config_from_file(filepath: pathlib.Path) -> dict[str, Any]:
         logger.info(f"Loading configuration from {filepath}")
         try:
             with open(filepath, "rb") as f:
-                config = tomllib.load(f)
+                # Intern keys parsed from TOML so lookups against the (already interned)
+                # literal keys of DEFAULT_CONFIG/CONFIG_TYPES hit the identity fast path
+                config = {sys.intern(key): value for key, value in tomllib.load(f).items()}
             logger.debug(f"Config loaded from file: {config}")
         except tomllib.TOMLDecodeError as e:
-            import sys
-
             # Print clear error to stderr for better user experience
             print(f"Error: Invalid TOML in configuration file {filepath}", file=sys.stderr)
             print(f"  {e}", file=sys.stderr)
             raise ConfigError(f"Invalid TOML in {filepath}: {e}") from e
         except Exception as e:
-            import sys
-
             print(f"Error: Cannot read configuration file {filepath}: {e}", file=sys.stderr)
             raise ConfigError(f"Error reading config file {filepath}: {e}") from e
     else:
@@ -137,6 +143,13 @@ def get_repo_config_path(start_path: Optional[pathlib.Path] = None) -> Optional[
     return repo_root / REPO_CONFIG_RELATIVE_PATH
 
 
+def _warn_unknown_parameter(name: str, types_schema: dict[str, type], source_name: str) -> None:
+    logger.warning(
+        f"Unknown configuration parameter '{name}' from {source_name}. "
+        f"This may be a typo. Known parameters: {', '.join(sorted(types_schema.keys()))}"
+    )
+
+
 def _convert_config_values(
     config_data: dict[str, Any], types_schema: dict[str, type], source_name: str, *, warn_unknown: bool = False
 ) -> dict[str, Any]:
@@ -158,10 +171,7 @@ def _convert_config_values(
     for name, value in config_data.items():
         if name not in types_schema:
             if warn_unknown:
-                logger.warning(
-                    f"Unknown configuration parameter '{name}' from {source_name}. "
-                    f"This may be a typo. Known parameters: {', '.join(sorted(types_schema.keys()))}"
-                )
+                _warn_unknown_parameter(name, types_schema, source_name)
             converted_config[name] = value
             logger.debug(f"Config parameter '{name}' from {source_name} has no defined type, using as is.")
             continue
@@ -242,50 +252,36 @@ def _resolve_config_file_paths(config_dict: dict[str, Any]) -> dict[str, Any]:
     return resolved_config
 
 
-def load_effective_config(args: list[str]) -> dict[str, Any]:
-    """
-    Loads configuration from defaults, user file, repository file, and CLI --conf- arguments.
-    Returns the final merged configuration dictionary.
+# Config files modified this recently are parsed without caching: an edit made within
+# the filesystem's timestamp granularity could leave the signature unchanged
+_RACY_WINDOW_NS = 2_000_000_000
 
-    Raises:
-        ConfigError: If configuration loading or parsing fails.
-    """
-    # 1. Start with script defaults
-    final_config = DEFAULT_CONFIG.copy()
-    logger.debug(f"Initial config from defaults: {final_config}")
 
-    # 2. Load and merge config from user config file
+def _config_file_signature(filepath: Optional[pathlib.Path]) -> Optional[tuple[int, int, int]]:
+    """Return an (inode, mtime_ns, size) signature for a config file, or None if absent."""
+    if filepath is None:
+        return None
+    try:
+        stat_result = os.stat(filepath)
+    except OSError:
+        return None
+    return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _load_typed_file_layer(filepath: pathlib.Path, source_name: str) -> dict[str, Any]:
+    """Load a TOML config file and convert its values, without resolving `@:` references."""
     try:
-        raw_file_config = load_config_from_file(CONFIG_FILE_PATH)
-        if raw_file_config:
-            # Warn about unknown keys in config file to help catch typos
-            typed_file_config = _convert_config_values(raw_file_config, CONFIG_TYPES, "file", warn_unknown=True)
-            resolved_file_config = _resolve_config_file_paths(typed_file_config)
-            final_config.update(resolved_file_config)
-            logger.debug(f"Config after merging file settings: {final_config}")
+        raw_config = load_config_from_file(filepath)
     except tomllib.TOMLDecodeError as e:
-        raise ConfigError(f"Error decoding TOML from {CONFIG_FILE_PATH}: {e}") from e
-    except ConfigError:
-        raise
+        raise ConfigError(f"Error decoding TOML from {filepath}: {e}") from e
+    if not raw_config:
+        return {}
+    # Unknown keys are reported by load_effective_config on every load, cached or not
+    return _convert_config_values(raw_config, CONFIG_TYPES, source_name)
 
-    # 3. Load and merge repository-level config if available
-    repo_config_path = get_repo_config_path()
-    if repo_config_path is not None:
-        try:
-            raw_repo_config = load_config_from_file(repo_config_path)
-            if raw_repo_config:
-                typed_repo_config = _convert_config_values(
-                    raw_repo_config, CONFIG_TYPES, "repository", warn_unknown=True
-                )
-                resolved_repo_config = _resolve_config_file_paths(typed_repo_config)
-                final_config.update(resolved_repo_config)
-                logger.debug(f"Config after merging repository settings: {final_config}")
-        except tomllib.TOMLDecodeError as e:
-            raise ConfigError(f"Error decoding TOML from {repo_config_path}: {e}") from e
-        except ConfigError:
-            raise
 
-    # 4. Extract and merge CLI configurations (--conf- args only)
+def _parse_cli_conf_args(args: tuple[str, ...]) -> dict[str, str]:
+    """Extract raw `--conf-<name> <value>` pairs from the argument list."""
     cli_raw_conf_params: dict[str, str] = {}
     i = 0
     while i < len(args):
@@ -293,7 +289,7 @@ def load_effective_config(args: list[str]) -> dict[str, Any]:
         if arg.startswith("--conf-"):
             if i + 1 >= len(args):
                 raise ConfigError(f"Configuration argument '{arg}' requires a value.")
-            conf_name = arg[len("--conf-") :]
+            conf_name = sys.intern(arg[len("--conf-") :])
             if not conf_name:
                 raise ConfigError(f"Configuration argument '{arg}' is missing a name after '--conf-'.")
             cli_raw_conf_params[conf_name] = args[i + 1]
@@ -301,17 +297,94 @@ def load_effective_config(args: list[str]) -> dict[str, Any]:
             i += 2
         else:
             i += 1
+    return cli_raw_conf_params
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_layers(
+    args: tuple[str, ...],
+    user_config_path: pathlib.Path,
+    user_signature: Optional[tuple[int, int, int]],
+    repo_config_path: Optional[pathlib.Path],
+    repo_signature: Optional[tuple[int, int, int]],
+) -> tuple[MappingProxyType, MappingProxyType, MappingProxyType]:
+    """Parse and type-convert the user, repository and CLI layers.
+
+    Results are memoized on the argument tuple plus the stat signature of each config
+    file, so editing a file invalidates the entry. `@:` references are deliberately left
+    unresolved here so referenced files are always read fresh by the caller.
+    """
+    del user_signature, repo_signature  # Only part of the cache key
+    user_layer = _load_typed_file_layer(user_config_path, "file")
+    repo_layer = _load_typed_file_layer(repo_config_path, "repository") if repo_config_path is not None else {}
 
-    if cli_raw_conf_params:
-        typed_cli_config = _convert_config_values(cli_raw_conf_params, CONFIG_TYPES, "CLI")
-        resolved_cli_config = _resolve_config_file_paths(typed_cli_config)
-        final_config.update(resolved_cli_config)
-        logger.debug(f"Config after merging CLI settings: {final_config}")
+    cli_raw_conf_params = _parse_cli_conf_args(args)
+    cli_layer = _convert_config_values(cli_raw_conf_params, CONFIG_TYPES, "CLI") if cli_raw_conf_params else {}
+
+    return MappingProxyType(user_layer), MappingProxyType(repo_layer), MappingProxyType(cli_layer)
+
+
+def _resolve_layer(layer: MappingProxyType) -> dict[str, Any]:
+    """Return a mutable copy of a cached layer with `@:` references resolved."""
+    if not layer:
+        return {}
+    # Copy list values so callers never mutate the cached layer
+    layer_config = {key: list(value) if isinstance(value, list) else value for key, value in layer.items()}
+    return _resolve_config_file_paths(layer_config)
+
+
+def load_effective_config(args: list[str]) -> dict[str, Any]:
+    """
+    Loads configuration from defaults, user file, repository file, and CLI --conf- arguments.
+    Returns the final merged configuration dictionary.
+
+    Parsed layers are cached per argument list and config file signature, except for
+    files modified within the last two seconds; unknown-key warnings are logged on every
+    call. The returned dictionary is always a fresh copy that callers may mutate.
+
+    Raises:
+        ConfigError: If configuration loading or parsing fails.
+    """
+    repo_config_path = get_repo_config_path()
+    user_signature = _config_file_signature(CONFIG_FILE_PATH)
+    repo_signature = _config_file_signature(repo_config_path)
+
+    # Files edited just now may be edited again without changing their signature
+    load_layers = _load_config_layers
+    now_ns = time.time_ns()
+    if any(
+        signature is not None and now_ns - signature[1] <= _RACY_WINDOW_NS
+        for signature in (user_signature, repo_signature)
+    ):
+        load_layers = _load_config_layers.__wrapped__
+    user_layer, repo_layer, cli_layer = load_layers(
+        tuple(args), CONFIG_FILE_PATH, user_signature, repo_config_path, repo_signature
+    )
+
+    # Warn about unknown keys in config files to help catch typos
+    for layer, source_name in ((user_layer, "file"), (repo_layer, "repository")):
+        for name in layer:
+            if name not in CONFIG_TYPES:
+                _warn_unknown_parameter(name, CONFIG_TYPES, source_name)
+
+    # Merge defaults < user file < repository file < CLI in a single union expression
+    final_config = DEFAULT_CONFIG | _resolve_layer(user_layer) | _resolve_layer(repo_layer) | _resolve_layer(cli_layer)
 
     logger.info(f"Effective Configuration: {final_config}")
     return final_config
 
 
+def _resolve_template_root(path_str: str, base: str) -> pathlib.Path:
+    """Expand, anchor and canonicalize one template root path.
+
+    Equivalent to ``(Path(base) / Path(path_str).expanduser()).resolve()`` but done with
+    ``os.path`` string operations so only the final ``Path`` is allocated.
+    """
+    expanded = os.path.expanduser(os.fspath(path_str))
+    # os.path.join discards base when expanded is already absolute
+    return pathlib.Path(os.path.realpath(os.path.join(base, expanded)))
+
+
 def get_template_roots(config: dict[str, Any]) -> dict[str, list[pathlib.Path]]:
     """Resolve template root paths from configuration.
 
@@ -338,10 +411,12 @@ def get_template_roots(config: dict[str, Any]) -> dict[str, list[pathlib.Path]]:
         "builtin": [],
     }
 
-    # Get the repository root for resolving project-relative paths
-    repo_root = find_git_repo_root()
-    if repo_root is None:
-        repo_root = pathlib.Path.cwd()
+    # Fast path for the default startup case: no template paths configured,
+    # so skip the Git root lookup and all path resolution
+    if not any(config.get(key) for key in TEMPLATE_PATH_KEYS):
+        return result
+
+    home_str = os.path.expanduser("~")
 
     # Process project template paths
     project_paths = config.get("project-template-paths")
@@ -349,9 +424,14 @@ def get_template_roots(config: dict[str, Any]) -> dict[str, list[pathlib.Path]]:
         if not isinstance(project_paths, list):
             logger.warning(f"project-template-paths should be a list, got {type(project_paths)}")
             project_paths = [project_paths]
+        # Relative paths are anchored at the repository root; its lookup walks up the
+        # directory tree, so it only runs once a relative path needs it
+        repo_root_str = ""
         for path_str in project_paths:
-            path = pathlib.Path(path_str).expanduser()
-            path = (repo_root / path).resolve() if not path.is_absolute() else path.resolve()
+            if not repo_root_str and not os.path.isabs(os.path.expanduser(os.fspath(path_str))):
+                repo_root = find_git_repo_root()
+                repo_root_str = os.fspath(repo_root) if repo_root is not None else os.getcwd()
+            path = _resolve_template_root(path_str, repo_root_str)
             result["project"].append(path)
             logger.debug(f"Resolved project template path: {path_str} -> {path}")
 
@@ -362,9 +442,8 @@ def get_template_roots(config: dict[str, Any]) -> dict[str, list[pathlib.Path]]:
             logger.warning(f"user-template-paths should be a list, got {type(user_paths)}")
             user_paths = [user_paths]
         for path_str in user_paths:
-            path = pathlib.Path(path_str).expanduser()
             # Resolve relative user paths against home directory
-            path = (pathlib.Path.home() / path).resolve() if not path.is_absolute() else path.resolve()
+            path = _resolve_template_root(path_str, home_str)
             result["user"].append(path)
             logger.debug(f"Resolved user template path: {path_str} -> {path}")
 
@@ -375,9 +454,8 @@ def get_template_roots(config: dict[str, Any]) -> dict[str, list[pathlib.Path]]:
             logger.warning(f"builtin-template-paths should be a list, got {type(builtin_paths)}")
             builtin_paths = [builtin_paths]
         for path_str in builtin_paths:
-            path = pathlib.Path(path_str).expanduser()
             # Resolve relative builtin paths against home directory
-            path = (pathlib.Path.home() / path).resolve() if not path.is_absolute() else path.resolve()
+            path = _resolve_template_root(path_str, home_str)
             result["builtin"].append(path)
             logger.debug(f"Resolved builtin template path: {path_str} -> {path}")
 
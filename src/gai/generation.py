@@ -3,7 +3,7 @@
 import logging
 import os
 import sys
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
 from pathlib import Path
 from typing import Any, Optional
 
@@ -15,6 +15,14 @@ from .templates import render_system_instruction, render_user_instruction
 
 logger = logging.getLogger(__name__)
 
+# Config keys forwarded verbatim to GenerateContentConfig, as
+# (config key, API field name, omit when None)
+_GENERATE_CONFIG_FIELDS: tuple[tuple[str, str, bool], ...] = (
+    ("temperature", "temperature", False),
+    ("response-mime-type", "response_mime_type", False),
+    ("max-output-tokens", "max_output_tokens", True),
+)
+
 
 def prepare_prompt_contents(config: dict[str, Any], template_variables: dict[str, str]) -> list[types.Content]:
     """
@@ -38,26 +46,17 @@ def prepare_generate_content_config_dict(config: dict[str, Any], template_variab
     Applies template variables to the system instruction using Jinja2.
     Only includes non-None values to avoid potential API compatibility issues.
     """
-    temperature = config.get("temperature")
-    response_mime_type = config.get("response-mime-type")
-    max_output_tokens = config.get("max-output-tokens")
-
-    logger.info(f"Using temperature: {temperature}")
-    logger.info(f"Using response_mime_type: {response_mime_type}")
-    if max_output_tokens is not None:
-        logger.info(f"Using max_output_tokens: {max_output_tokens}")
-
-    system_instruction_text = render_system_instruction(config, template_variables)
-    logger.debug(f"Templated System Instruction:\n{system_instruction_text or 'None'}")
-
     # Build config dict with only non-None values for better API compatibility
     generate_config_dict: dict[str, Any] = {
-        "temperature": temperature,
-        "response_mime_type": response_mime_type,
+        field_name: value
+        for config_key, field_name, optional in _GENERATE_CONFIG_FIELDS
+        if (value := config.get(config_key)) is not None or not optional
     }
+    for field_name, value in generate_config_dict.items():
+        logger.info(f"Using {field_name}: {value}")
 
-    if max_output_tokens is not None:
-        generate_config_dict["max_output_tokens"] = max_output_tokens
+    system_instruction_text = render_system_instruction(config, template_variables)
+    logger.debug(f"Templated System Instruction:\n{system_instruction_text or 'None'}")
 
     if system_instruction_text is not None:
         generate_config_dict["system_instruction"] = system_instruction_text
@@ -117,24 +116,79 @@ def collect_output(stream_generator: Generator[types.GenerateContentResponse, No
 
 
 def extract_between_tags(text: str, tag_name: str) -> str:
-    """Extract the substring between <TAG> and </TAG> from text."""
+    """Extract the substring between the first <TAG> and the following </TAG> in text."""
 
     start_tag = f"<{tag_name}>"
     end_tag = f"</{tag_name}>"
 
-    start_index = text.find(start_tag)
-    if start_index == -1:
+    _, found_start, after_start = text.partition(start_tag)
+    if not found_start:
         raise GenerationError(f"Tag '{start_tag}' not found in generation output.")
 
-    start_index += len(start_tag)
-    end_index = text.find(end_tag, start_index)
-    if end_index == -1:
+    captured, found_end, _ = after_start.partition(end_tag)
+    if not found_end:
         raise GenerationError(f"Closing tag '{end_tag}' not found in generation output.")
 
-    return text[start_index:end_index]
+    return captured
+
+
+def stream_between_tags(
+    stream_generator: Iterable[types.GenerateContentResponse], tag_name: str, sink: Callable[[str], Any]
+) -> None:
+    """Stream the text between the first <TAG> and the following </TAG> to sink.
+
+    Chunks are scanned incrementally, so only a tail shorter than the tag being
+    searched for is held back between chunks instead of the whole response. Tags may
+    be split across chunk boundaries. Consumption stops at the closing tag.
 
+    Raises:
+        GenerationError: If the opening or closing tag never appears.
+    """
+    start_tag = f"<{tag_name}>"
+    end_tag = f"</{tag_name}>"
+    pending = ""
+    capturing = False
+
+    for chunk in stream_generator:
+        if not chunk.text:
+            continue
+        pending += chunk.text
+
+        if not capturing:
+            start_index = pending.find(start_tag)
+            if start_index == -1:
+                # Keep just enough to recognize an opening tag split across chunks
+                pending = pending[-(len(start_tag) - 1) :]
+                continue
+            pending = pending[start_index + len(start_tag) :]
+            capturing = True
+
+        end_index = pending.find(end_tag)
+        if end_index != -1:
+            if end_index:
+                sink(pending[:end_index])
+            return
+
+        # Emit everything except a possible partial closing tag
+        keep = len(end_tag) - 1
+        if len(pending) > keep:
+            sink(pending[:-keep])
+            pending = pending[-keep:]
+
+    if not capturing:
+        raise GenerationError(f"Tag '{start_tag}' not found in generation output.")
+    raise GenerationError(f"Closing tag '{end_tag}' not found in generation output.")
+
+
+def _emit_captured_output(
+    stream_generator: Iterable[types.GenerateContentResponse], capture_tag: str, output_file: Optional[str]
+) -> None:
+    # Only the tagged block is held in memory, and nothing is written until its
+    # closing tag arrives, so a missing tag never leaves partial output behind
+    parts: list[str] = []
+    stream_between_tags(stream_generator, capture_tag, parts.append)
+    captured_text = "".join(parts)
 
-def _emit_captured_output(captured_text: str, output_file: Optional[str]) -> None:
     if output_file:
         Path(output_file).write_text(captured_text, encoding="utf-8")
         logger.info("Captured output written to %s", output_file)
@@ -177,9 +231,7 @@ def generate(
     try:
         stream_generator = execute_generation_stream(client, model_name, contents, generate_config_dict)
         if capture_tag:
-            full_text = collect_output(stream_generator)
-            captured = extract_between_tags(full_text, capture_tag)
-            _emit_captured_output(captured, output_file)
+            _emit_captured_output(stream_generator, capture_tag, output_file)
         else:
             stream_output(stream_generator)
     except GenerationError:
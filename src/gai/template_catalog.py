@@ -13,9 +13,16 @@ the CatalogLoader in templates.py uses this catalog to resolve all nested
 references using consistent tier precedence rules.
 """
 
+import functools
 import logging
+import os
 import pathlib
-from dataclasses import dataclass
+import re
+import stat
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from typing import Literal
 
 logger = logging.getLogger(__name__)
@@ -26,6 +33,10 @@ TierType = Literal["project", "user", "builtin"]
 # Recognized template file extensions
 DEFAULT_TEMPLATE_EXTENSIONS = (".j2", ".j2.md")
 
+# Logical names that can never match a discovered template: empty, leading,
+# trailing or doubled slashes, and "." or ".." segments
+INVALID_LOGICAL_NAME = re.compile(r"^$|^/|/$|//|(?:^|/)\.{1,2}(?:/|$)")
+
 # Tier precedence ordering (lower index = higher precedence)
 TIER_PRECEDENCE: dict[TierType, int] = {
     "project": 0,
@@ -33,11 +44,34 @@ TIER_PRECEDENCE: dict[TierType, int] = {
     "builtin": 2,
 }
 
+# Canonical tier strings, shared by every record of a tier
+_TIER_INTERN: dict[str, TierType] = {tier: sys.intern(tier) for tier in TIER_PRECEDENCE}
+
+# Directory listings from earlier scans, keyed by directory path and validated
+# against the directory's mtime: (st_mtime_ns, sorted (name, path, is_dir) entries)
+_DirListing = tuple[tuple[str, str, bool], ...]
+_LISTING_CACHE_SIZE = 1024
+_listing_cache: dict[str, tuple[int, _DirListing]] = {}
+
+# Complete discovery results keyed by (absolute roots per tier, allowed extensions):
+# ((path, st_mtime_ns or None) for every root and directory scanned, records).
+# A hit costs one stat per directory instead of a walk.
+_discovery_cache: dict[tuple, tuple[tuple[tuple[str, int | None], ...], tuple["TemplateRecord", ...]]] = {}
+_DISCOVERY_CACHE_SIZE = 8
+
+# Listings and results involving directories modified this recently are not
+# cached: a change made within the filesystem's timestamp granularity could
+# leave the mtime unchanged
+_RACY_WINDOW_NS = 2_000_000_000
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TemplateRecord:
     """Represents a discovered template file with metadata.
 
+    Records are immutable (and therefore hashable) so catalogs can be shared and
+    used as cache keys without defensive copies.
+
     Attributes:
         logical_name_full: Canonical logical name without extension (e.g., "layout/base_conversation")
         relative_path: Path relative to its root, including extension (e.g., "layout/base_conversation.j2")
@@ -45,6 +79,7 @@ class TemplateRecord:
         tier: The tier this template belongs to ("project", "user", or "builtin")
         root_index: Zero-based index of the root within its tier
         extension: File extension including the dot (e.g., ".j2", ".j2.md")
+        tier_rank: Precedence of the tier from TIER_PRECEDENCE, derived from tier
     """
 
     logical_name_full: str
@@ -53,13 +88,22 @@ class TemplateRecord:
     tier: TierType
     root_index: int
     extension: str
+    tier_rank: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Validate the template record after initialization."""
-        if self.tier not in TIER_PRECEDENCE:
+        """Validate the template record after initialization.
+
+        Tier and extension are replaced by their canonical interned strings, so records
+        built from strings read at runtime still compare equal by identity.
+        """
+        tier_rank = TIER_PRECEDENCE.get(self.tier)
+        if tier_rank is None:
             raise ValueError(f"Invalid tier: {self.tier}")
         if not self.extension.startswith("."):
             raise ValueError(f"Extension must start with '.': {self.extension}")
+        object.__setattr__(self, "tier", _TIER_INTERN[self.tier])
+        object.__setattr__(self, "extension", sys.intern(self.extension))
+        object.__setattr__(self, "tier_rank", tier_rank)
 
 
 def discover_templates(
@@ -90,8 +134,6 @@ def discover_templates(
         Non-existent roots are skipped with a debug log message.
         Non-regular files and files with unrecognized extensions are ignored.
     """
-    records: list[TemplateRecord] = []
-
     # Process tiers in precedence order
     tiers: list[tuple[TierType, list[pathlib.Path]]] = [
         ("project", project_roots),
@@ -99,112 +141,259 @@ def discover_templates(
         ("builtin", builtin_roots),
     ]
 
+    cache_key = (
+        tuple(tuple(os.path.abspath(root) for root in roots) for _, roots in tiers),
+        allowed_extensions,
+    )
+    cached = _discovery_cache.get(cache_key)
+    if cached is not None and all(_directory_mtime(path) == mtime_ns for path, mtime_ns in cached[0]):
+        return list(cached[1])
+
+    records: list[TemplateRecord] = []
+    visited: list[tuple[str, int | None]] = []
+    extensions_by_length = extensions_longest_first(allowed_extensions)
+
+    # Pass 1 touches only the filesystem, pass 2 only builds Python objects
+    for tier_name, root_index, files in _scan_all_entries(tiers, visited):
+        records.extend(_build_records(files, tier_name, root_index, extensions_by_length))
+
+    now_ns = time.time_ns()
+    if all(mtime_ns is None or now_ns - mtime_ns > _RACY_WINDOW_NS for _, mtime_ns in visited):
+        if len(_discovery_cache) >= _DISCOVERY_CACHE_SIZE:
+            # Evict the oldest entry
+            del _discovery_cache[next(iter(_discovery_cache))]
+        _discovery_cache[cache_key] = (tuple(visited), tuple(records))
+
+    return records
+
+
+def _scan_all_entries(
+    tiers: list[tuple[TierType, list[pathlib.Path]]],
+    visited: list[tuple[str, int | None]],
+) -> list[tuple[TierType, int, list[tuple[str, str]]]]:
+    """Walk every existing root and collect its files, in catalog order.
+
+    Args:
+        tiers: (tier name, roots) pairs in precedence order
+        visited: Receives (path, mtime_ns) for each directory scanned, with None
+            for roots that are missing or not directories
+
+    Returns:
+        List of (tier, root_index, files) with files as returned by _walk_files
+    """
+    scanned: list[tuple[TierType, int, list[tuple[str, str]]]] = []
     for tier_name, roots in tiers:
         for root_index, root_path in enumerate(roots):
-            if not root_path.exists():
+            # A single stat distinguishes missing roots from non-directory roots
+            try:
+                root_mode = os.stat(root_path).st_mode
+            except OSError:
                 logger.debug(f"Template root does not exist, skipping: {root_path}")
+                visited.append((os.fspath(root_path), None))
                 continue
 
-            if not root_path.is_dir():
+            if not stat.S_ISDIR(root_mode):
                 logger.warning(f"Template root is not a directory, skipping: {root_path}")
+                visited.append((os.fspath(root_path), None))
                 continue
 
             logger.debug(f"Scanning template root [{tier_name}:{root_index}]: {root_path}")
+            scanned.append((tier_name, root_index, list(_walk_files(root_path, visited))))
+    return scanned
+
+
+def _build_records(
+    files: list[tuple[str, str]],
+    tier_name: TierType,
+    root_index: int,
+    extensions_by_length: tuple[str, ...],
+) -> list[TemplateRecord]:
+    """Create TemplateRecords for the files of one root that have a template extension.
 
-            # Recursively walk the directory
-            for file_path in sorted(root_path.rglob("*")):
-                # Skip non-regular files
-                if not file_path.is_file():
-                    continue
-
-                # Check if extension is recognized
-                extension = _get_template_extension(file_path, allowed_extensions)
-                if extension is None:
-                    continue
-
-                # Compute relative path from root
-                try:
-                    relative_path = file_path.relative_to(root_path)
-                except ValueError:
-                    logger.warning(f"Could not compute relative path for {file_path} from {root_path}")
-                    continue
-
-                # Compute logical name by removing extension and normalizing separators
-                logical_name_full = _compute_logical_name(relative_path, extension)
-
-                # Create template record
-                record = TemplateRecord(
-                    logical_name_full=logical_name_full,
-                    relative_path=relative_path,
-                    absolute_path=file_path,
-                    tier=tier_name,
-                    root_index=root_index,
-                    extension=extension,
-                )
-                records.append(record)
-
-                logger.debug(f"Discovered template: {logical_name_full} -> {file_path}")
+    Args:
+        files: (relative name, absolute path) pairs from _walk_files
+        tier_name: Tier of the root
+        root_index: Index of the root within its tier
+        extensions_by_length: Allowed extensions, longest first
+
+    Returns:
+        List of TemplateRecord objects in walk order
+    """
+    records: list[TemplateRecord] = []
+    for relative_name, file_path in files:
+        # Check if extension is recognized
+        extension = _get_template_extension(relative_name, extensions_by_length)
+        if extension is None:
+            continue
+
+        # The walker already joins components with forward slashes, so the
+        # logical name is a plain slice (interned so resolver dict lookups
+        # compare by identity first)
+        logical_name_full = sys.intern(relative_name[: -len(extension)])
+
+        records.append(
+            TemplateRecord(
+                logical_name_full=logical_name_full,
+                relative_path=pathlib.Path(relative_name),
+                absolute_path=pathlib.Path(file_path),
+                tier=tier_name,
+                root_index=root_index,
+                extension=extension,
+            )
+        )
+        logger.debug(f"Discovered template: {logical_name_full} -> {file_path}")
 
     return records
 
 
-def _get_template_extension(file_path: pathlib.Path, allowed_extensions: tuple[str, ...]) -> str | None:
-    """Determine if a file has a recognized template extension.
+def clear_discovery_cache() -> None:
+    """Forget all cached discovery results and directory listings, forcing a rescan."""
+    _discovery_cache.clear()
+    _listing_cache.clear()
+
+
+def _directory_mtime(path: str) -> int | None:
+    """Return a directory's st_mtime_ns, or None if it is missing or not a directory."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns if stat.S_ISDIR(st.st_mode) else None
+
+
+def _scan_sorted(directory: str, visited: list[tuple[str, int | None]]) -> _DirListing:
+    """List a directory's subdirectories and files sorted by name.
+
+    Listings are reused while the directory's mtime is unchanged, since adding,
+    removing or renaming an entry updates it. Each subdirectory is validated
+    separately when it is visited. Returns nothing if the directory cannot be read.
+    The directory and the mtime it was listed at are appended to visited.
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+        visited.append((directory, mtime_ns))
+        cached = _listing_cache.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with os.scandir(directory) as entries:
+            listing = [
+                (entry.name, entry.path, is_dir) for entry in entries if (is_dir := _is_walkable_dir(entry)) is not None
+            ]
+    except OSError as e:
+        logger.debug(f"Cannot scan template directory {directory}: {e}")
+        # Never matches a readable directory, so results involving it are not reused
+        visited.append((directory, None))
+        return ()
+
+    result = tuple(sorted(listing))
+    if time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+        if len(_listing_cache) >= _LISTING_CACHE_SIZE:
+            # Evict the oldest entry
+            del _listing_cache[next(iter(_listing_cache))]
+        _listing_cache[directory] = (mtime_ns, result)
+    return result
+
+
+def _is_walkable_dir(entry: os.DirEntry) -> bool | None:
+    """Return True for real subdirectories, False for files, None for anything else."""
+    try:
+        if entry.is_dir(follow_symlinks=False):
+            return True
+        if entry.is_file():
+            return False
+    except OSError as e:
+        logger.debug(f"Cannot inspect template path {entry.path}: {e}")
+    return None
+
+
+def _walk_files(root_path: pathlib.Path, visited: list[tuple[str, int | None]]) -> Iterator[tuple[str, str]]:
+    """Recursively yield the regular files below a template root.
+
+    Uses an explicit stack of directory listings from _scan_sorted, whose type checks
+    reuse the d_type information from readdir instead of issuing a stat per entry. Entries are
+    visited in name order, which yields files in the same order as
+    ``sorted(root_path.rglob("*"))``. Like rglob, symlinked directories are not
+    descended into, while symlinks to regular files are reported.
 
     Args:
-        file_path: Path to the file
-        allowed_extensions: Tuple of allowed extensions
+        root_path: The template root directory to walk
+        visited: Receives (path, mtime_ns) for every directory listed
 
     Returns:
-        The matched extension (including dot) or None if not recognized
+        Iterator of (relative path with forward slashes, absolute path) pairs
     """
-    file_name = file_path.name
+    stack: list[tuple[Iterator[tuple[str, str, bool]], str]] = [(iter(_scan_sorted(os.fspath(root_path), visited)), "")]
+    while stack:
+        entries, prefix = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
 
-    # Check each allowed extension
-    for ext in allowed_extensions:
-        if file_name.endswith(ext):
-            return ext
+        name, path, is_dir = entry
+        if is_dir:
+            stack.append((iter(_scan_sorted(path, visited)), f"{prefix}{name}/"))
+        else:
+            yield prefix + name, path
 
-    return None
 
+@functools.lru_cache(maxsize=16)
+def extensions_longest_first(allowed_extensions: tuple[str, ...]) -> tuple[str, ...]:
+    """Order extensions longest first, so a file matching several gets the most specific one."""
+    return tuple(sorted(allowed_extensions, key=len, reverse=True))
 
-def _compute_logical_name(relative_path: pathlib.Path, extension: str) -> str:
-    """Compute the logical name for a template file.
 
-    The logical name is the relative path without the extension, with forward
-    slashes as separators (even on Windows).
+def _get_template_extension(file_name: str, allowed_extensions: tuple[str, ...]) -> str | None:
+    """Determine if a file has a recognized template extension.
 
     Args:
-        relative_path: Path relative to the template root
-        extension: The file extension (including dot)
+        file_name: Name (or relative path) of the file
+        allowed_extensions: Tuple of allowed extensions, longest first
 
     Returns:
-        Logical name as a string with forward slashes
+        The matched extension (including dot) or None if not recognized
     """
-    # Convert to string with forward slashes
-    path_str = relative_path.as_posix()
-
-    # Remove the extension
-    if path_str.endswith(extension):
-        path_str = path_str[: -len(extension)]
+    # Reject most non-template files with a single C-level suffix check
+    if not file_name.endswith(allowed_extensions):
+        return None
 
-    return path_str
+    return next(ext for ext in allowed_extensions if file_name.endswith(ext))
 
 
 class TemplateCatalog:
     """A collection of discovered templates with utility methods.
 
-    This class wraps a list of TemplateRecord objects and provides methods
-    for querying and filtering the catalog.
+    This class wraps an immutable sequence of TemplateRecord objects and provides
+    methods for querying and filtering the catalog. Catalogs with the same records
+    compare and hash equal, so they can serve as cache keys.
     """
 
-    def __init__(self, records: list[TemplateRecord]):
+    def __init__(self, records: Iterable[TemplateRecord]):
         """Initialize the catalog with template records.
 
         Args:
-            records: List of TemplateRecord objects (should be pre-sorted)
+            records: TemplateRecord objects (should be pre-sorted)
         """
-        self.records = records
+        self.records: tuple[TemplateRecord, ...] = tuple(records)
+        # Records partitioned by tier in a single pass, preserving catalog order
+        self._by_tier: dict[str, list[TemplateRecord]] = {tier: [] for tier in TIER_PRECEDENCE}
+        for record in self.records:
+            self._by_tier[record.tier].append(record)
+        self._logical_names = tuple(record.logical_name_full for record in self.records)
+        self._hash: int | None = None
+
+    def __eq__(self, other: object) -> bool:
+        """Catalogs are equal when they hold the same records in the same order."""
+        if not isinstance(other, TemplateCatalog):
+            return NotImplemented
+        return self.records == other.records
+
+    def __hash__(self) -> int:
+        """Hash the records once; the catalog never changes after construction."""
+        if self._hash is None:
+            self._hash = hash(self.records)
+        return self._hash
 
     def __len__(self) -> int:
         """Return the number of templates in the catalog."""
@@ -223,7 +412,7 @@ class TemplateCatalog:
         Returns:
             List of TemplateRecord objects for the specified tier
         """
-        return [r for r in self.records if r.tier == tier]
+        return list(self._by_tier.get(tier, ()))
 
     def get_all_logical_names(self) -> list[str]:
         """Get all logical names in catalog order.
@@ -231,7 +420,54 @@ class TemplateCatalog:
         Returns:
             List of logical_name_full strings in catalog order
         """
-        return [r.logical_name_full for r in self.records]
+        return list(self._logical_names)
+
+
+# Template sources read by any loader, keyed by absolute path and validated against
+# the file's (st_mtime_ns, st_size): (mtime_ns, size, source)
+_SOURCE_CACHE_SIZE = 256
+_source_cache: dict[str, tuple[int, int, str]] = {}
+
+
+def read_template_source(path: os.PathLike[str] | str) -> tuple[str, float]:
+    """Return a template file's text and mtime, reusing an earlier read while it is unchanged.
+
+    Environments for different catalogs share template files (e.g. the listing's
+    environment and the one used for rendering), so one stat replaces re-reading and
+    re-decoding a file that has not changed. Files modified within the timestamp
+    granularity are not cached, as a later edit could keep the same mtime and size.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    cached = _source_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], st.st_mtime
+
+    # Raw os.read calls bypass the buffered text layer; newlines are left untranslated,
+    # which Jinja's lexer accepts in any style
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Take the mtime from the open file so it describes exactly the content read
+        st = os.fstat(fd)
+        remaining = st.st_size
+        chunks: list[bytes] = []
+        while True:
+            # Keep reading past the stat size in case the file grew or reads come back short
+            chunk = os.read(fd, max(remaining, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    source = b"".join(chunks).decode("utf-8")
+
+    if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+        if len(_source_cache) >= _SOURCE_CACHE_SIZE:
+            # Evict the oldest entry
+            del _source_cache[next(iter(_source_cache))]
+        _source_cache[path] = (st.st_mtime_ns, st.st_size, source)
+    return source, st.st_mtime
 
 
 def build_template_catalog(config: dict[str, any]) -> TemplateCatalog:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import pathlib
 import re
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Mapping, Optional, Sequence
@@ -10,8 +12,15 @@ import jinja2
 from jinja2 import meta
 
 from .exceptions import TemplateError
-from .template_catalog import TemplateRecord, resolve_template_name
-from .templates import create_jinja_env_from_catalog
+from .template_catalog import (
+    DEFAULT_TEMPLATE_EXTENSIONS,
+    INVALID_LOGICAL_NAME,
+    TIER_PRECEDENCE,
+    TemplateRecord,
+    extensions_longest_first,
+    read_template_source,
+)
+from .templates import create_jinja_env_from_catalog, resolve_template_name
 
 OUTPUT_TAG_PATTERN = re.compile(r"<(O_[A-Za-z0-9_]+)>")
 
@@ -46,20 +55,25 @@ def build_template_interface(
 ) -> TemplateInterface:
     """Build the TemplateInterface for a logical template name."""
 
+    record: TemplateRecord | None = None
     records = list(catalog) if catalog is not None else None
     if records is None:
-        from .template_catalog import build_template_catalog
+        record = _probe_path_specific_record(config, logical_name)
+        if record is None:
+            from .template_catalog import build_template_catalog
 
-        catalog_obj = build_template_catalog(config)
-        records = list(catalog_obj.records)
+            catalog_obj = build_template_catalog(config)
+            records = list(catalog_obj.records)
 
     if jinja_env is None:
-        jinja_env = create_jinja_env_from_catalog(records)
+        # Only used to parse the template, so the probed record alone is enough
+        jinja_env = create_jinja_env_from_catalog(records if records is not None else [record])
 
-    record = resolve_template_name(records, logical_name)
+    if record is None:
+        record = resolve_template_name(records, logical_name)
 
     try:
-        source = record.absolute_path.read_text(encoding="utf-8")
+        source, _mtime = read_template_source(record.absolute_path)
     except OSError as exc:  # pragma: no cover - filesystem errors are rare
         raise TemplateError(f"Unable to read template '{logical_name}': {exc}") from exc
 
@@ -70,15 +84,18 @@ def build_template_interface(
 
     undeclared = meta.find_undeclared_variables(ast)
 
-    def _classify(prefix: str) -> dict[str, str]:
-        names = sorted(v for v in undeclared if v.startswith(prefix))
-        return {name: name[len(prefix) :].lstrip("_") for name in names}
-
-    inputs = _classify("I_")
-    controls = _classify("C_")
-    mechanisms = _classify("M_")
-    categorized = set(inputs) | set(controls) | set(mechanisms)
-    other_variables = {var for var in undeclared if var not in categorized}
+    # Classify every variable in one sorted pass by its two-character role prefix
+    inputs: dict[str, str] = {}
+    controls: dict[str, str] = {}
+    mechanisms: dict[str, str] = {}
+    other_variables: set[str] = set()
+    by_prefix = {"I_": inputs, "C_": controls, "M_": mechanisms}
+    for name in sorted(undeclared):
+        bucket = by_prefix.get(name[:2])
+        if bucket is None:
+            other_variables.add(name)
+        else:
+            bucket[name] = name[2:].lstrip("_")
 
     outputs = set(OUTPUT_TAG_PATTERN.findall(source))
 
@@ -90,3 +107,69 @@ def build_template_interface(
         outputs=outputs,
         other_variables=other_variables,
     )
+
+
+def _probe_path_specific_record(config: Mapping[str, Any], logical_name: str) -> TemplateRecord | None:
+    """Find a path-specific template by probing candidate files instead of walking every root.
+
+    Only names containing a "/" can be probed, since basename-only names may match
+    at any depth. Returns None whenever the probe cannot decide on its own (invalid
+    or basename-only name, no match, or several matches within one tier); callers
+    then fall back to full discovery, which also produces the proper errors.
+    """
+    if INVALID_LOGICAL_NAME.search(logical_name):
+        return None
+
+    # Same extensions, matched in the same order, as discovery and resolve_template_name
+    allowed_extensions = extensions_longest_first(DEFAULT_TEMPLATE_EXTENSIONS)
+    extension = next((ext for ext in allowed_extensions if logical_name.endswith(ext)), None)
+    base_name = logical_name[: -len(extension)] if extension else logical_name
+    if "/" not in base_name:
+        return None
+    extensions = (extension,) if extension else allowed_extensions
+
+    from .config import get_template_roots
+
+    roots = get_template_roots(dict(config))
+    directories = base_name.split("/")[:-1]
+    for tier in TIER_PRECEDENCE:
+        hits: list[TemplateRecord] = []
+        for root_index, root in enumerate(roots[tier]):
+            root_str = os.fspath(root)
+            # Discovery does not descend into symlinked directories, so neither does the probe
+            if any(os.path.islink(os.path.join(root_str, *directories[: i + 1])) for i in range(len(directories))):
+                continue
+            for ext in extensions:
+                relative_name = base_name + ext
+                absolute_path = os.path.join(root_str, relative_name)
+                if os.path.isfile(absolute_path) and _has_exact_case(root_str, relative_name):
+                    hits.append(
+                        TemplateRecord(
+                            logical_name_full=base_name,
+                            relative_path=pathlib.Path(relative_name),
+                            absolute_path=pathlib.Path(absolute_path),
+                            tier=tier,
+                            root_index=root_index,
+                            extension=ext,
+                        )
+                    )
+        if hits:
+            return hits[0] if len(hits) == 1 else None
+    return None
+
+
+def _has_exact_case(root: str, relative_name: str) -> bool:
+    """Whether every component of relative_name exists below root with exactly this case.
+
+    Case-insensitive filesystems also open differently cased paths, which discovery,
+    working from directory listings, would never report.
+    """
+    directory = root
+    for part in relative_name.split("/"):
+        try:
+            if part not in os.listdir(directory):
+                return False
+        except OSError:
+            return False
+        directory = os.path.join(directory, part)
+    return True
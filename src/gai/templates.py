@@ -11,13 +11,26 @@ or import other templates to any depth, and all templates share the same variabl
 context and catalog-based resolver.
 """
 
+import functools
+import hashlib
+import importlib.metadata
 import logging
-from typing import Any, Optional
+import os
+from collections.abc import Callable, Iterable, MutableMapping
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Optional, Union
 
 import jinja2
 
-from .exceptions import TemplateAmbiguityError, TemplateError, TemplateNotFoundError
-from .template_catalog import DEFAULT_TEMPLATE_EXTENSIONS, TIER_PRECEDENCE, TemplateRecord
+from .exceptions import TemplateAmbiguityError, TemplateError, TemplateNotFoundError, TemplateResolutionError
+from .template_catalog import (
+    DEFAULT_TEMPLATE_EXTENSIONS,
+    INVALID_LOGICAL_NAME,
+    TemplateRecord,
+    extensions_longest_first,
+    read_template_source,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +55,12 @@ def create_jinja_env() -> jinja2.Environment:
 JINJA_ENV = create_jinja_env()
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_template_string(template_str: str) -> jinja2.Template:
+    """Compile a literal template string once and reuse the Template for later renders."""
+    return JINJA_ENV.from_string(template_str)
+
+
 def render_template_string(
     template_str: Optional[str], template_variables: dict[str, Any], template_name: str
 ) -> Optional[str]:
@@ -57,7 +76,7 @@ def render_template_string(
         return None
 
     try:
-        template = JINJA_ENV.from_string(str(template_str))
+        template = _compile_template_string(str(template_str))
         rendered_text = template.render(template_variables)
         logger.debug(f"Successfully rendered template '{template_name}'.")
         return rendered_text
@@ -70,8 +89,45 @@ def render_template_string(
         raise TemplateError(f"An unexpected error occurred during '{template_name}' templating: {e}") from e
 
 
+@dataclass(frozen=True)
+class _CatalogIndex:
+    """Lookup tables over a template catalog, built once per catalog.
+
+    Each bucket holds the records sharing a full logical name (or basename),
+    sorted by tier precedence while preserving catalog order within a tier.
+
+    Attributes:
+        by_full_name: Records keyed by ``logical_name_full``
+        by_basename: Records keyed by the last segment of ``logical_name_full``
+        searched_roots: Sorted parent directories of all records, for error messages
+    """
+
+    by_full_name: dict[str, tuple[TemplateRecord, ...]]
+    by_basename: dict[str, tuple[TemplateRecord, ...]]
+    searched_roots: tuple[str, ...]
+
+    @classmethod
+    def from_records(cls, catalog: Iterable[TemplateRecord]) -> "_CatalogIndex":
+        """Build the index in a single pass over the catalog."""
+        by_full_name: dict[str, list[TemplateRecord]] = {}
+        by_basename: dict[str, list[TemplateRecord]] = {}
+        searched_roots: set[str] = set()
+
+        for record in sorted(catalog, key=attrgetter("tier_rank")):
+            full_name = record.logical_name_full
+            by_full_name.setdefault(full_name, []).append(record)
+            by_basename.setdefault(full_name.rpartition("/")[2], []).append(record)
+            searched_roots.add(os.path.dirname(record.absolute_path))
+
+        return cls(
+            by_full_name={name: tuple(bucket) for name, bucket in by_full_name.items()},
+            by_basename={name: tuple(bucket) for name, bucket in by_basename.items()},
+            searched_roots=tuple(sorted(searched_roots)),
+        )
+
+
 def resolve_template_name(
-    catalog: list[TemplateRecord],
+    catalog: Union[Iterable[TemplateRecord], _CatalogIndex],
     logical_name: str,
     allowed_extensions: tuple[str, ...] = DEFAULT_TEMPLATE_EXTENSIONS,
 ) -> TemplateRecord:
@@ -86,7 +142,8 @@ def resolve_template_name(
     - Raises TemplateNotFoundError if no matches found in any tier
 
     Args:
-        catalog: List of TemplateRecord objects to search
+        catalog: TemplateRecord objects to search, or a prebuilt _CatalogIndex
+            (callers resolving repeatedly against one catalog should build it once)
         logical_name: The logical name to resolve (e.g., "summary" or "layout/base.j2")
         allowed_extensions: Tuple of recognized template extensions
 
@@ -97,11 +154,19 @@ def resolve_template_name(
         TemplateNotFoundError: If no template matches the logical name
         TemplateAmbiguityError: If multiple templates match in the same tier
     """
-    # Step 1: Check if the name includes an explicit extension
+    index = catalog if isinstance(catalog, _CatalogIndex) else _CatalogIndex.from_records(catalog)
+
+    # Reject names no discovered template can have (empty, leading/trailing or
+    # doubled slashes, "." or ".." segments) without consulting the index
+    if INVALID_LOGICAL_NAME.search(logical_name):
+        raise TemplateNotFoundError(logical_name, list(index.searched_roots))
+
+    # Step 1: Check if the name includes an explicit extension; the longest match
+    # wins, so ".j2.md" is not mistaken for ".md" whatever order extensions come in
     required_extension: Optional[str] = None
     base_name = logical_name
 
-    for ext in allowed_extensions:
+    for ext in extensions_longest_first(allowed_extensions):
         if logical_name.endswith(ext):
             required_extension = ext
             base_name = logical_name[: -len(ext)]
@@ -111,64 +176,31 @@ def resolve_template_name(
         f"Resolving template name: '{logical_name}' -> base_name='{base_name}', required_extension={required_extension}"
     )
 
-    # Step 2: Determine if this is a path-specific or basename-only name
-    is_path_specific = "/" in base_name
-
-    # Step 3: Group catalog by tier
-    records_by_tier: dict[str, list[TemplateRecord]] = {}
-    searched_roots: set[str] = set()
-
-    for record in catalog:
-        tier = record.tier
-        if tier not in records_by_tier:
-            records_by_tier[tier] = []
-        records_by_tier[tier].append(record)
-        searched_roots.add(str(record.absolute_path.parent))
-
-    # Step 4: Process tiers in precedence order
-    tier_order = sorted(TIER_PRECEDENCE.keys(), key=lambda t: TIER_PRECEDENCE[t])
-
-    for tier in tier_order:
-        tier_records = records_by_tier.get(tier, [])
-        if not tier_records:
-            continue
-
-        # Step 5: Find candidates in this tier
-        tier_candidates: list[TemplateRecord] = []
-
-        for record in tier_records:
-            # Check logical name match
-            if is_path_specific:
-                # Path-specific: exact match required
-                if record.logical_name_full != base_name:
-                    continue
-            else:
-                # Basename-only: match last path segment
-                record_basename = record.logical_name_full.split("/")[-1]
-                if record_basename != base_name:
-                    continue
-
-            # Check extension match
-            if required_extension is not None and record.extension != required_extension:
-                continue
-
-            tier_candidates.append(record)
-
-        # Step 6: Handle candidates for this tier
-        if len(tier_candidates) == 0:
-            # No matches in this tier, continue to next tier
-            continue
-        if len(tier_candidates) == 1:
-            # Exactly one match - success!
-            logger.debug(f"Resolved '{logical_name}' to {tier_candidates[0].absolute_path}")
-            return tier_candidates[0]
-
-        # Multiple matches - ambiguity error
-        candidates_info = [(str(r.relative_path), r.extension) for r in tier_candidates]
-        raise TemplateAmbiguityError(logical_name, tier, candidates_info)
-
-    # Step 7: No tier had any candidates
-    raise TemplateNotFoundError(logical_name, sorted(searched_roots))
+    # Step 2: Path-specific names match the full logical name exactly,
+    # basename-only names match the last path segment
+    buckets = index.by_full_name if "/" in base_name else index.by_basename
+    candidates = buckets.get(base_name, ())
+
+    # Step 3: Check extension match
+    if required_extension is not None:
+        candidates = tuple(r for r in candidates if r.extension == required_extension)
+
+    # Step 4: No tier had any candidates
+    if not candidates:
+        raise TemplateNotFoundError(logical_name, list(index.searched_roots))
+
+    # Step 5: Buckets are in tier precedence order, so the first tier with
+    # candidates is the tier of the first record
+    tier = candidates[0].tier
+    tier_rank = candidates[0].tier_rank
+    tier_candidates = [r for r in candidates if r.tier_rank == tier_rank]
+    if len(tier_candidates) == 1:
+        logger.debug(f"Resolved '{logical_name}' to {tier_candidates[0].absolute_path}")
+        return tier_candidates[0]
+
+    # Multiple matches - ambiguity error
+    candidates_info = [(str(r.relative_path), r.extension) for r in tier_candidates]
+    raise TemplateAmbiguityError(logical_name, tier, candidates_info)
 
 
 class CatalogLoader(jinja2.BaseLoader):
@@ -189,17 +221,39 @@ class CatalogLoader(jinja2.BaseLoader):
     """
 
     def __init__(
-        self, catalog: list[TemplateRecord], allowed_extensions: tuple[str, ...] = DEFAULT_TEMPLATE_EXTENSIONS
+        self,
+        catalog: Union[Iterable[TemplateRecord], Callable[[], Iterable[TemplateRecord]]],
+        allowed_extensions: tuple[str, ...] = DEFAULT_TEMPLATE_EXTENSIONS,
     ):
         """Initialize the loader with a template catalog.
 
         Args:
-            catalog: List of TemplateRecord objects to use for resolution
+            catalog: TemplateRecord objects to use for resolution, or a callable returning
+                them. A callable is invoked once, when the first template is requested, so
+                a loader that is never used never discovers templates.
             allowed_extensions: Tuple of recognized template extensions
         """
         self._catalog = catalog
         self._allowed_extensions = allowed_extensions
-        logger.debug(f"CatalogLoader initialized with {len(catalog)} templates")
+        # Resolution outcome by requested name: the record, or a factory for the lookup
+        # error to raise again. The catalog never changes, so entries never go stale.
+        self._resolved: dict[str, Union[TemplateRecord, Callable[[], TemplateResolutionError]]] = {}
+
+    @functools.cached_property
+    def _index(self) -> _CatalogIndex:
+        """Index over the catalog, built on first use."""
+        records = self._catalog() if callable(self._catalog) else self._catalog
+        index = _CatalogIndex.from_records(records)
+        logger.debug(f"CatalogLoader indexed {sum(map(len, index.by_full_name.values()))} templates")
+        return index
+
+    def list_templates(self) -> list[str]:
+        """Return the sorted, distinct logical names of the catalog's templates."""
+        return sorted(self._index.by_full_name)
+
+    def clear_cache(self) -> None:
+        """Forget all remembered name resolutions."""
+        self._resolved.clear()
 
     def get_source(self, _environment: jinja2.Environment, template: str) -> tuple[str, Optional[str], Optional[Any]]:
         """Load a template by its logical name.
@@ -220,49 +274,102 @@ class CatalogLoader(jinja2.BaseLoader):
         Raises:
             jinja2.TemplateNotFound: If the template cannot be resolved or read
         """
+        record = self._resolve(template)
+        absolute_path = os.fspath(record.absolute_path)
+
+        # Read the template content
         try:
-            # Resolve the logical name to a template record
-            record = resolve_template_name(self._catalog, template, self._allowed_extensions)
-            absolute_path = record.absolute_path
+            source, mtime = read_template_source(absolute_path)
+        except Exception as e:
+            raise jinja2.TemplateNotFound(template, message=f"Error reading template file: {e}") from e
 
-            # Read the template content
+        # Create uptodate function that checks if file hasn't been modified
+        def uptodate() -> bool:
             try:
-                source = absolute_path.read_text(encoding="utf-8")
-            except Exception as e:
-                raise jinja2.TemplateNotFound(template, message=f"Error reading template file: {e}") from e
+                return os.stat(absolute_path).st_mtime == mtime
+            except OSError:
+                return False
 
-            # Get file modification time for caching
-            try:
-                mtime = absolute_path.stat().st_mtime
-            except Exception:
-                mtime = None
-
-            # Create uptodate function that checks if file hasn't been modified
-            def uptodate() -> bool:
-                if mtime is None:
-                    return False
-                try:
-                    return absolute_path.stat().st_mtime == mtime
-                except Exception:
-                    return False
-
-            logger.debug(f"Loaded template '{template}' from {absolute_path}")
-            return source, str(absolute_path), uptodate
+        logger.debug(f"Loaded template '{template}' from {absolute_path}")
+        return source, absolute_path, uptodate
+
+    def canonical_name(self, template: str) -> str:
+        """Return the one name under which every reference to a catalog file is cached.
 
+        "summary", "summary.j2" and "email/summary" all map to "email/summary.j2" when
+        they resolve to that file. Names that do not resolve are returned unchanged, so
+        loading them reports the name that was requested.
+        """
+        try:
+            record = self._resolve(template)
+            canonical = record.logical_name_full + record.extension
+            if canonical != template and self._resolve(canonical) is not record:
+                return template
+        except jinja2.TemplateNotFound:
+            return template
+        return canonical
+
+    def _resolve(self, template: str) -> TemplateRecord:
+        """Resolve a requested name to its record, remembering the outcome.
+
+        Raises:
+            jinja2.TemplateNotFound: If the name is missing or ambiguous in the catalog
+        """
+        record = self._resolved.get(template)
+        if isinstance(record, TemplateRecord):
+            return record
+
+        try:
+            if record is not None:
+                # A new error each time, so cached errors never collect causes or tracebacks
+                raise record()
+            record = resolve_template_name(self._index, template, self._allowed_extensions)
         except TemplateNotFoundError as e:
-            # Convert to Jinja2's TemplateNotFound exception
+            self._resolved[template] = functools.partial(TemplateNotFoundError, e.logical_name, e.searched_roots)
             raise jinja2.TemplateNotFound(template, message=str(e)) from e
         except TemplateAmbiguityError as e:
-            # Convert to TemplateNotFound with the ambiguity message
-            # (Jinja2 doesn't have a built-in ambiguity exception type)
+            self._resolved[template] = functools.partial(TemplateAmbiguityError, e.logical_name, e.tier, e.candidates)
+            # Jinja2 doesn't have a built-in ambiguity exception type
             raise jinja2.TemplateNotFound(template, message=str(e)) from e
         except Exception as e:
             raise jinja2.TemplateNotFound(template, message=f"Unexpected error: {e}") from e
 
+        self._resolved[template] = record
+        return record
+
+
+# Compiled templates kept per catalog environment (Jinja's default is 400)
+_TEMPLATE_CACHE_SIZE = 1024
+
+
+class _CatalogEnvironment(jinja2.Environment):
+    """Environment that caches each catalog template once, whatever name it is loaded by.
+
+    Jinja's template cache is keyed by the requested name, so "summary", "summary.j2"
+    and "email/summary" would each compile the same file. Names are mapped to the
+    loader's canonical name first, for direct loads and for extends/include/import.
+    """
+
+    def join_path(self, template: str, _parent: str) -> str:
+        return self.loader.canonical_name(template)
+
+    def get_template(
+        self,
+        name: Union[str, jinja2.Template],
+        parent: Optional[str] = None,
+        globals: Optional[MutableMapping[str, Any]] = None,  # noqa: A002
+    ) -> jinja2.Template:
+        if isinstance(name, str) and parent is None:
+            name = self.loader.canonical_name(name)
+        return super().get_template(name, parent, globals)
+
 
 def create_jinja_env_from_catalog(
-    catalog: list[TemplateRecord],
+    catalog: Union[Iterable[TemplateRecord], Callable[[], Iterable[TemplateRecord]]],
     allowed_extensions: tuple[str, ...] = DEFAULT_TEMPLATE_EXTENSIONS,
+    *,
+    auto_reload: bool = True,
+    cache_size: int = _TEMPLATE_CACHE_SIZE,
 ) -> jinja2.Environment:
     """Create a Jinja2 environment that uses catalog-based template resolution.
 
@@ -277,23 +384,175 @@ def create_jinja_env_from_catalog(
     same catalog using consistent tier precedence rules.
 
     Args:
-        catalog: List of TemplateRecord objects for template resolution
+        catalog: TemplateRecord objects for template resolution, or a callable
+            returning them on first use (see CatalogLoader)
         allowed_extensions: Tuple of recognized template extensions
+        auto_reload: Whether loaded templates are checked for changes on each use
+            (one stat per template); disable only for catalogs that never change
+        cache_size: Number of compiled templates the environment keeps
 
     Returns:
         A configured Jinja2 Environment
     """
-    env = jinja2.Environment(
+    env = _CatalogEnvironment(
         loader=CatalogLoader(catalog, allowed_extensions),
         undefined=jinja2.StrictUndefined,
         autoescape=False,
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=auto_reload,
+        cache_size=cache_size,
     )
+    if not os.environ.get(_NO_BYTECODE_CACHE_ENV):
+        env.bytecode_cache = _bytecode_cache(_environment_fingerprint(env))
     logger.debug("Created Jinja2 environment with CatalogLoader")
     return env
 
 
+class _LazyBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that creates its directory when the first template is stored.
+
+    Environments that never compile a template (e.g. parse-only interface inspection)
+    leave no directory behind, and a cache that cannot be written is skipped instead of
+    failing the render.
+    """
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Could not store compiled template in {self.directory}: {e}")
+
+
+# Set to any non-empty value to keep compiled templates in memory only
+_NO_BYTECODE_CACHE_ENV = "GAI_NO_BYTECODE_CACHE"
+
+
+def _environment_fingerprint(env: jinja2.Environment) -> str:
+    """Return a short digest of the environment settings that shape compiled template code."""
+    settings = (
+        env.block_start_string,
+        env.block_end_string,
+        env.variable_start_string,
+        env.variable_end_string,
+        env.comment_start_string,
+        env.comment_end_string,
+        env.line_statement_prefix,
+        env.line_comment_prefix,
+        env.trim_blocks,
+        env.lstrip_blocks,
+        env.newline_sequence,
+        env.keep_trailing_newline,
+        env.optimized,
+        env.autoescape if isinstance(env.autoescape, bool) else "callable",
+        sorted(env.extensions),
+        sorted(env.filters),
+        sorted(env.tests),
+    )
+    return hashlib.sha256(repr(settings).encode()).hexdigest()[:16]
+
+
+@functools.cache
+def _bytecode_cache(fingerprint: str) -> Optional[jinja2.FileSystemBytecodeCache]:
+    """Return the on-disk cache of compiled catalog templates, or None if unavailable.
+
+    Compiled templates are stored under $XDG_CACHE_HOME/gai/jinja/<gai>-<jinja2>-<fingerprint>
+    (default ~/.cache), so a fresh process skips lexing and parsing templates it has seen
+    before. Jinja keys entries on the template source checksum; the installed versions and
+    the environment fingerprint in the path invalidate them when Jinja's compiler or the
+    environment settings change, including in editable checkouts whose version stays put.
+    Set GAI_NO_BYTECODE_CACHE to disable the cache.
+    """
+    try:
+        versions = f"{importlib.metadata.version('gai')}-{importlib.metadata.version('jinja2')}"
+    except importlib.metadata.PackageNotFoundError:
+        # Without installed metadata nothing would invalidate stale entries
+        logger.debug("Template bytecode cache disabled, package metadata not found")
+        return None
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return _LazyBytecodeCache(os.path.join(cache_home, "gai", "jinja", f"{versions}-{fingerprint}"))
+
+
+# Maximum number of catalog environments kept by get_environment()
+_ENVIRONMENT_CACHE_SIZE = 8
+_environment_cache: dict[tuple, jinja2.Environment] = {}
+
+
+def get_environment(
+    catalog: Iterable[TemplateRecord],
+    allowed_extensions: tuple[str, ...] = DEFAULT_TEMPLATE_EXTENSIONS,
+) -> jinja2.Environment:
+    """Return a shared catalog-backed Jinja2 environment for the given catalog.
+
+    Environments are memoized on the catalog contents (not its identity), so
+    repeated renders against the same set of templates reuse the environment's
+    compiled-template cache instead of re-parsing every template. Jinja's
+    auto-reload check still picks up edits to the underlying template files.
+
+    Args:
+        catalog: TemplateRecord objects for template resolution
+        allowed_extensions: Tuple of recognized template extensions
+
+    Returns:
+        A configured Jinja2 Environment (see create_jinja_env_from_catalog)
+    """
+    records = tuple(catalog)
+    key = (allowed_extensions, records)
+    env = _environment_cache.get(key)
+    if env is None:
+        env = create_jinja_env_from_catalog(list(records), allowed_extensions)
+        if len(_environment_cache) >= _ENVIRONMENT_CACHE_SIZE:
+            # Evict the oldest entry
+            del _environment_cache[next(iter(_environment_cache))]
+        _environment_cache[key] = env
+    return env
+
+
+def _render_named_template(
+    config: dict[str, Any], template_name: str, template_vars: dict[str, Any], label: str
+) -> str:
+    """Render a named template from the catalog built from the configured roots.
+
+    Args:
+        config: Configuration dictionary providing the template roots
+        template_name: Logical name of the template to render
+        template_vars: Template variables for rendering
+        label: What is being rendered, for log and error messages (e.g. "user instruction")
+
+    Raises:
+        TemplateError: If template rendering fails
+        TemplateNotFoundError: If the template cannot be found
+        TemplateAmbiguityError: If the template is ambiguous
+    """
+    # Import here to avoid circular dependency
+    from .config import get_template_roots
+    from .template_catalog import discover_templates
+
+    # Build catalog from configured roots
+    roots = get_template_roots(config)
+    catalog = discover_templates(roots["project"], roots["user"], roots["builtin"])
+
+    # Reuse the environment (and its compiled templates) for this catalog
+    env = get_environment(catalog)
+
+    try:
+        template = env.get_template(template_name)
+        rendered = template.render(template_vars)
+        logger.debug(f"Successfully rendered {label} from template '{template_name}'")
+        return rendered
+    except jinja2.TemplateNotFound as e:
+        # If the underlying cause is one of our richer errors, re-raise it.
+        cause = e.__cause__
+        if isinstance(cause, (TemplateNotFoundError, TemplateAmbiguityError)):
+            raise cause from e
+        # Fallback: surface a generic template error with Jinja's message.
+        raise TemplateError(f"Error rendering {label} template '{template_name}': {e}") from e
+    except jinja2.exceptions.TemplateError as e:
+        raise TemplateError(f"Error rendering {label} template '{template_name}': {e}") from e
+
+
 def render_system_instruction(config: dict[str, Any], template_vars: dict[str, Any]) -> Optional[str]:
     """Render the system instruction using either named templates or literal strings.
 
@@ -321,31 +580,7 @@ def render_system_instruction(config: dict[str, Any], template_vars: dict[str, A
     template_name = config.get("system-instruction-template")
     if template_name:
         logger.debug(f"Using named template for system instruction: '{template_name}'")
-        # Import here to avoid circular dependency
-        from .config import get_template_roots
-        from .template_catalog import discover_templates
-
-        # Build catalog from configured roots
-        roots = get_template_roots(config)
-        catalog = discover_templates(roots["project"], roots["user"], roots["builtin"])
-
-        # Create environment with catalog loader
-        env = create_jinja_env_from_catalog(catalog)
-
-        try:
-            template = env.get_template(template_name)
-            rendered = template.render(template_vars)
-            logger.debug(f"Successfully rendered system instruction from template '{template_name}'")
-            return rendered
-        except jinja2.TemplateNotFound as e:
-            # If the underlying cause is one of our richer errors, re-raise it.
-            cause = e.__cause__
-            if isinstance(cause, (TemplateNotFoundError, TemplateAmbiguityError)):
-                raise cause from e
-            # Fallback: surface a generic template error with Jinja's message.
-            raise TemplateError(f"Error rendering system instruction template '{template_name}': {e}") from e
-        except jinja2.exceptions.TemplateError as e:
-            raise TemplateError(f"Error rendering system instruction template '{template_name}': {e}") from e
+        return _render_named_template(config, template_name, template_vars, "system instruction")
 
     # Fall back to literal template string
     literal_template = config.get("system-instruction")
@@ -379,29 +614,7 @@ def render_user_instruction(config: dict[str, Any], template_vars: dict[str, Any
     template_name = config.get("user-instruction-template")
     if template_name:
         logger.debug(f"Using named template for user instruction: '{template_name}'")
-        # Import here to avoid circular dependency
-        from .config import get_template_roots
-        from .template_catalog import discover_templates
-
-        # Build catalog from configured roots
-        roots = get_template_roots(config)
-        catalog = discover_templates(roots["project"], roots["user"], roots["builtin"])
-
-        # Create environment with catalog loader
-        env = create_jinja_env_from_catalog(catalog)
-
-        try:
-            template = env.get_template(template_name)
-            rendered = template.render(template_vars)
-            logger.debug(f"Successfully rendered user instruction from template '{template_name}'")
-            return rendered
-        except jinja2.TemplateNotFound as e:
-            cause = e.__cause__
-            if isinstance(cause, (TemplateNotFoundError, TemplateAmbiguityError)):
-                raise cause from e
-            raise TemplateError(f"Error rendering user instruction template '{template_name}': {e}") from e
-        except jinja2.exceptions.TemplateError as e:
-            raise TemplateError(f"Error rendering user instruction template '{template_name}': {e}") from e
+        return _render_named_template(config, template_name, template_vars, "user instruction")
 
     # Fall back to literal template string
     literal_template = config.get("user-instruction")
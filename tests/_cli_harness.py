@@ -0,0 +1,42 @@
+"""In-process runner for the gai command line, in the spirit of Click's CliRunner."""
+
+import functools
+import io
+import logging
+from collections import namedtuple
+from contextlib import redirect_stderr, redirect_stdout
+
+CliResult = namedtuple("CliResult", ["returncode", "stdout", "stderr"])
+
+
+def invoke(argv: list[str]) -> CliResult:
+    """Run ``gai <argv>`` in-process, capturing its output and exit code like subprocess.run.
+
+    Goes through gai.__main__.main, so argument parsing, command dispatch and the
+    error-to-exit-code mapping are the same as for the installed script.
+    """
+    from gai.__main__ import main
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    # Route log records to the captured stderr, as the CLI's basicConfig would in a fresh process
+    root_logger = logging.getLogger()
+    root_level = root_logger.level
+    handler = logging.StreamHandler(stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    root_logger.addHandler(handler)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            main(list(argv))
+        returncode = 0
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+    finally:
+        root_logger.removeHandler(handler)
+        root_logger.setLevel(root_level)
+    return CliResult(returncode, stdout.getvalue(), stderr.getvalue())
+
+
+@functools.cache
+def invoke_cached(argv: tuple[str, ...]) -> CliResult:
+    """Like invoke, running each distinct command only once per process."""
+    return invoke(list(argv))
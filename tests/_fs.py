@@ -0,0 +1,21 @@
+"""Filesystem helpers for building template trees in tests."""
+
+import os
+from pathlib import Path
+
+
+def write_all(root: Path, files: dict[str, str]) -> Path:
+    """Write a {relative path: content} mapping below root and return root.
+
+    Root and each parent directory are created once, and each file is written with a single
+    os.write on a raw descriptor, skipping pathlib's text-file wrapper.
+    """
+    for directory in sorted({os.path.dirname(name) for name in files}):
+        os.makedirs(root / directory, exist_ok=True)
+    for name, content in files.items():
+        fd = os.open(root / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+    return root
@@ -0,0 +1,84 @@
+"""Shared pytest fixtures."""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from . import _cli_harness, _fs
+
+# Resolved once at import; only consulted when --live-api is given
+_API_KEY = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live-api",
+        action="store_true",
+        default=False,
+        help="Run google-genai tests against the live API (needs GOOGLE_API_KEY or GEMINI_API_KEY).",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_bytecode_cache(tmp_path_factory):
+    """Keep compiled template caches out of the user's ~/.cache.
+
+    Runs before any test creates a catalog environment, which is when gai picks the directory.
+    """
+    mp = pytest.MonkeyPatch()
+    mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg-cache")))
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def cfg_files(tmp_path_factory):
+    """Directory with read-only config fixture files shared across the session."""
+    directory = tmp_path_factory.mktemp("cfg")
+    (directory / "template.txt").write_text("Template from file")
+    (directory / "config.toml").write_text('model = "gemini-2.0-flash-exp"\ntemperature = 0.5\n')
+    return directory
+
+
+@pytest.fixture
+def mktemplates(tmp_path):
+    """Callable writing a {relative path: content} mapping below tmp_path and returning tmp_path."""
+
+    def make(spec: dict[str, str]) -> Path:
+        return _fs.write_all(tmp_path, spec)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def genai_client(request):
+    """A google-genai client: the real one with --live-api, otherwise an offline fake answering "hi"."""
+    from google import genai
+
+    if request.config.getoption("--live-api"):
+        if _API_KEY is None:
+            pytest.skip("GOOGLE_API_KEY or GEMINI_API_KEY environment variable not set")
+        return genai.Client(api_key=_API_KEY)
+
+    fake = Mock(spec=genai.Client)
+    fake.models.generate_content.return_value = SimpleNamespace(text="hi")
+    fake.models.generate_content_stream.side_effect = lambda **_kwargs: iter([SimpleNamespace(text="hi")])
+    return fake
+
+
+@pytest.fixture(scope="session")
+def run_cli():
+    """Callable running ``gai <argv>`` in-process and returning (returncode, stdout, stderr)."""
+    return _cli_harness.invoke
+
+
+@pytest.fixture(scope="session")
+def static_cli_output():
+    """Like run_cli, for commands whose output does not depend on the test.
+
+    Takes the arguments as a tuple; each distinct command runs once per session.
+    """
+    return _cli_harness.invoke_cached
@@ -1,5 +1,5 @@
 from gai.__main__ import _apply_user_template_override
-from gai.cli import parse_template_args_from_list
+from gai.cli import parse_args_for_new_cli, parse_template_args_from_list
 
 
 def test_apply_user_template_override_adds_conf_flag():
@@ -22,3 +22,24 @@ def test_template_variable_aliases_inputs_and_controls():
     assert parsed["document"] == "text"
     assert parsed["I_document"] == "text"
     assert parsed["C_document"] == "text"
+
+
+def test_render_positional_template_name_with_template_variables():
+    parsed, template_vars = parse_args_for_new_cli(["template", "render", "prompts/sample", "--document", "text"])
+
+    assert parsed.template_name == "prompts/sample"
+    assert template_vars["document"] == "text"
+
+
+def test_render_template_option_with_template_variables():
+    parsed, template_vars = parse_args_for_new_cli(["template", "render", "-t", "prompts/sample", "--document", "text"])
+
+    assert parsed.template == "prompts/sample"
+    assert template_vars["document"] == "text"
+
+
+def test_render_template_variable_value_is_not_taken_as_template_name():
+    parsed, template_vars = parse_args_for_new_cli(["template", "render", "--document", "text"])
+
+    assert parsed.template_name is None
+    assert template_vars["document"] == "text"
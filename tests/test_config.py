@@ -1,7 +1,7 @@
 """Tests for configuration module."""
 
-import pathlib
-import tempfile
+import logging
+import os
 
 import pytest
 
@@ -53,17 +53,10 @@ def test_convert_config_values_invalid():
         _convert_config_values(config_data, CONFIG_TYPES, "test")
 
 
-def test_read_file_content_success():
+def test_read_file_content_success(cfg_files):
     """Test reading file content successfully."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write("Test content")
-        temp_path = f.name
-
-    try:
-        content = read_file_content(temp_path)
-        assert content == "Test content"
-    finally:
-        pathlib.Path(temp_path).unlink()
+    content = read_file_content(str(cfg_files / "template.txt"))
+    assert content == "Template from file"
 
 
 def test_read_file_content_not_found():
@@ -72,50 +65,32 @@ def test_read_file_content_not_found():
         read_file_content("/nonexistent/file.txt")
 
 
-def test_resolve_config_file_paths():
+def test_resolve_config_file_paths(cfg_files):
     """Test resolving @: paths in config."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write("Template from file")
-        temp_path = f.name
-
-    try:
-        config = {
-            "system-instruction": f"@:{temp_path}",
-            "user-instruction": "Direct instruction",
-            "model": "gemini-flash-latest",
-        }
+    config = {
+        "system-instruction": f"@:{cfg_files / 'template.txt'}",
+        "user-instruction": "Direct instruction",
+        "model": "gemini-flash-latest",
+    }
 
-        resolved = _resolve_config_file_paths(config)
+    resolved = _resolve_config_file_paths(config)
 
-        assert resolved["system-instruction"] == "Template from file"
-        assert resolved["user-instruction"] == "Direct instruction"
-        assert resolved["model"] == "gemini-flash-latest"
-    finally:
-        pathlib.Path(temp_path).unlink()
+    assert resolved["system-instruction"] == "Template from file"
+    assert resolved["user-instruction"] == "Direct instruction"
+    assert resolved["model"] == "gemini-flash-latest"
 
 
-def test_load_config_from_file_not_exists():
+def test_load_config_from_file_not_exists(tmp_path):
     """Test loading config from non-existent file returns empty dict."""
-    # Use tempfile to create a path that doesn't exist (security S108)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        fake_path = pathlib.Path(tmpdir) / "nonexistent-config-file-12345.toml"
-        config = load_config_from_file(fake_path)
-        assert config == {}
+    config = load_config_from_file(tmp_path / "nonexistent-config-file-12345.toml")
+    assert config == {}
 
 
-def test_load_config_from_file_success():
+def test_load_config_from_file_success(cfg_files):
     """Test loading valid TOML config file."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".toml") as f:
-        f.write('model = "gemini-2.0-flash-exp"\n')
-        f.write("temperature = 0.5\n")
-        temp_path = pathlib.Path(f.name)
-
-    try:
-        config = load_config_from_file(temp_path)
-        assert config["model"] == "gemini-2.0-flash-exp"
-        assert config["temperature"] == 0.5
-    finally:
-        temp_path.unlink()
+    config = load_config_from_file(cfg_files / "config.toml")
+    assert config["model"] == "gemini-2.0-flash-exp"
+    assert config["temperature"] == 0.5
 
 
 def test_load_effective_config_defaults_only():
@@ -190,3 +165,65 @@ def test_load_effective_config_empty_name():
 
     with pytest.raises(ConfigError, match="missing a name"):
         load_effective_config(args)
+
+
+def test_load_effective_config_returns_fresh_copy_and_tracks_file_changes(monkeypatch, tmp_path):
+    """Cached layers must not leak mutations and must notice config file edits."""
+
+    user_config_path = tmp_path / "user.toml"
+    user_config_path.write_text('model = "first-model"\nproject-template-paths = ["a"]\n')
+
+    from gai import config as config_module
+
+    monkeypatch.setattr(config_module, "CONFIG_FILE_PATH", user_config_path)
+    monkeypatch.setattr(config_module, "get_repo_config_path", lambda *_args, **_kwargs: None)
+
+    first = load_effective_config([])
+    first["model"] = "mutated"
+    first["project-template-paths"].append("b")
+
+    second = load_effective_config([])
+    assert second["model"] == "first-model"
+    assert second["project-template-paths"] == ["a"]
+
+    user_config_path.write_text('model = "second-model-with-longer-name"\n')
+    assert load_effective_config([])["model"] == "second-model-with-longer-name"
+
+
+def test_load_effective_config_rereads_recently_modified_file(monkeypatch, tmp_path):
+    """A same-size edit within the timestamp granularity must not return stale config."""
+
+    user_config_path = tmp_path / "user.toml"
+    user_config_path.write_text('model = "model-a"\n')
+
+    from gai import config as config_module
+
+    monkeypatch.setattr(config_module, "CONFIG_FILE_PATH", user_config_path)
+    monkeypatch.setattr(config_module, "get_repo_config_path", lambda *_args, **_kwargs: None)
+
+    assert load_effective_config([])["model"] == "model-a"
+    stat_result = user_config_path.stat()
+    user_config_path.write_text('model = "model-b"\n')
+    os.utime(user_config_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+
+    assert load_effective_config([])["model"] == "model-b"
+
+
+def test_load_effective_config_warns_about_unknown_keys_every_time(monkeypatch, tmp_path, caplog):
+    """Unknown-key warnings must not be swallowed by the layer cache."""
+
+    user_config_path = tmp_path / "user.toml"
+    user_config_path.write_text('modle = "typo"\n')
+    old_ns = 1_000_000_000
+    os.utime(user_config_path, ns=(old_ns, old_ns))
+
+    from gai import config as config_module
+
+    monkeypatch.setattr(config_module, "CONFIG_FILE_PATH", user_config_path)
+    monkeypatch.setattr(config_module, "get_repo_config_path", lambda *_args, **_kwargs: None)
+
+    with caplog.at_level(logging.WARNING, logger="gai.config"):
+        load_effective_config([])
+        load_effective_config([])
+
+    assert sum("Unknown configuration parameter 'modle'" in message for message in caplog.messages) == 2
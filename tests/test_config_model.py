@@ -5,6 +5,15 @@ import pytest
 from gai.config_model import Config
 from gai.exceptions import ConfigError
 
+_VALID_DEFAULTS = {
+    "model": "gemini-flash-latest",
+    "temperature": 0.5,
+    "response_mime_type": "text/plain",
+    "max_output_tokens": None,
+    "system_instruction": None,
+    "user_instruction": "Test",
+}
+
 
 def test_config_valid():
     """Test creating valid Config."""
@@ -22,30 +31,22 @@ def test_config_valid():
     assert config.max_output_tokens == 1000
 
 
-def test_config_temperature_too_low():
-    """Test temperature below 0.0 raises error."""
-    with pytest.raises(ConfigError, match="temperature must be between"):
-        Config(
-            model="gemini-flash-latest",
-            temperature=-0.1,
-            response_mime_type="text/plain",
-            max_output_tokens=None,
-            system_instruction=None,
-            user_instruction="Test",
-        )
-
-
-def test_config_temperature_too_high():
-    """Test temperature above 2.0 raises error."""
-    with pytest.raises(ConfigError, match="temperature must be between"):
-        Config(
-            model="gemini-flash-latest",
-            temperature=2.1,
-            response_mime_type="text/plain",
-            max_output_tokens=None,
-            system_instruction=None,
-            user_instruction="Test",
-        )
+@pytest.mark.parametrize(
+    ("field", "value", "message"),
+    [
+        ("temperature", -0.1, "temperature must be between"),
+        ("temperature", 2.1, "temperature must be between"),
+        ("max_output_tokens", -1, "max_output_tokens must be positive"),
+        ("max_output_tokens", 0, "max_output_tokens must be positive"),
+        ("model", "", "model name cannot be empty"),
+        ("model", "   ", "model name cannot be empty"),
+        ("response_mime_type", "text/html", "response_mime_type must be one of"),
+    ],
+)
+def test_config_invalid(field, value, message):
+    """Test out-of-range or malformed fields raise ConfigError."""
+    with pytest.raises(ConfigError, match=message):
+        Config(**{**_VALID_DEFAULTS, field: value})
 
 
 def test_config_temperature_boundary_values():
@@ -73,32 +74,6 @@ def test_config_temperature_boundary_values():
     assert config_max.temperature == 2.0
 
 
-def test_config_max_tokens_negative():
-    """Test negative max_output_tokens raises error."""
-    with pytest.raises(ConfigError, match="max_output_tokens must be positive"):
-        Config(
-            model="gemini-flash-latest",
-            temperature=0.5,
-            response_mime_type="text/plain",
-            max_output_tokens=-1,
-            system_instruction=None,
-            user_instruction="Test",
-        )
-
-
-def test_config_max_tokens_zero():
-    """Test zero max_output_tokens raises error."""
-    with pytest.raises(ConfigError, match="max_output_tokens must be positive"):
-        Config(
-            model="gemini-flash-latest",
-            temperature=0.5,
-            response_mime_type="text/plain",
-            max_output_tokens=0,
-            system_instruction=None,
-            user_instruction="Test",
-        )
-
-
 def test_config_max_tokens_none():
     """Test None max_output_tokens is accepted."""
     config = Config(
@@ -112,45 +87,6 @@ def test_config_max_tokens_none():
     assert config.max_output_tokens is None
 
 
-def test_config_empty_model():
-    """Test empty model name raises error."""
-    with pytest.raises(ConfigError, match="model name cannot be empty"):
-        Config(
-            model="",
-            temperature=0.5,
-            response_mime_type="text/plain",
-            max_output_tokens=None,
-            system_instruction=None,
-            user_instruction="Test",
-        )
-
-
-def test_config_whitespace_model():
-    """Test whitespace-only model name raises error."""
-    with pytest.raises(ConfigError, match="model name cannot be empty"):
-        Config(
-            model="   ",
-            temperature=0.5,
-            response_mime_type="text/plain",
-            max_output_tokens=None,
-            system_instruction=None,
-            user_instruction="Test",
-        )
-
-
-def test_config_invalid_mime_type():
-    """Test invalid response_mime_type raises error."""
-    with pytest.raises(ConfigError, match="response_mime_type must be one of"):
-        Config(
-            model="gemini-flash-latest",
-            temperature=0.5,
-            response_mime_type="text/html",
-            max_output_tokens=None,
-            system_instruction=None,
-            user_instruction="Test",
-        )
-
-
 def test_config_to_dict():
     """Test converting Config to dictionary."""
     config = Config(
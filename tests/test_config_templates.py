@@ -61,6 +61,33 @@ class TestGetTemplateRoots:
         assert roots["user"] == []
         assert roots["builtin"] == []
 
+    def test_empty_config_skips_repo_root_lookup(self, monkeypatch):
+        """Test that no Git root walk happens when no template paths are configured."""
+        from gai import config as config_module
+
+        def fail_lookup(*_args, **_kwargs):
+            raise AssertionError("find_git_repo_root should not be called")
+
+        monkeypatch.setattr(config_module, "find_git_repo_root", fail_lookup)
+
+        roots = get_template_roots(DEFAULT_CONFIG)
+
+        assert roots == {"project": [], "user": [], "builtin": []}
+
+    def test_absolute_project_paths_skip_repo_root_lookup(self, monkeypatch):
+        """Test that the Git root walk only happens for relative project paths."""
+        from gai import config as config_module
+
+        def fail_lookup(*_args, **_kwargs):
+            raise AssertionError("find_git_repo_root should not be called")
+
+        monkeypatch.setattr(config_module, "find_git_repo_root", fail_lookup)
+
+        roots = get_template_roots({"project-template-paths": ["/tmp/project", "~/templates"]})
+
+        assert roots["project"][0] == pathlib.Path("/tmp/project")
+        assert roots["project"][1].is_absolute()
+
     def test_absolute_paths(self):
         """Test resolution of absolute paths."""
         config = {
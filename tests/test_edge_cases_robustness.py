@@ -5,6 +5,7 @@ beyond the core specification, ensuring the system handles unusual inputs
 and error conditions gracefully.
 """
 
+import dataclasses
 import pathlib
 
 import jinja2
@@ -15,128 +16,90 @@ from gai.template_catalog import TemplateRecord, discover_templates
 from gai.templates import CatalogLoader, resolve_template_name
 
 
+@pytest.fixture(scope="module")
+def summary_catalog():
+    """Frozen single-record catalog shared by the resolution tests."""
+    return (
+        TemplateRecord(
+            logical_name_full="summary",
+            relative_path=pathlib.Path("summary.j2"),
+            absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
+            tier="project",
+            root_index=0,
+            extension=".j2",
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def layout_catalog():
+    """Frozen catalog holding a single nested template."""
+    return (
+        TemplateRecord(
+            logical_name_full="layout/base",
+            relative_path=pathlib.Path("layout/base.j2"),
+            absolute_path=pathlib.Path("/tmp/templates/layout/base.j2"),
+            tier="project",
+            root_index=0,
+            extension=".j2",
+        ),
+    )
+
+
 class TestInvalidLogicalNames:
     """Tests for handling invalid or edge-case logical names."""
 
-    def test_resolve_empty_logical_name(self):
+    def test_resolve_empty_logical_name(self, summary_catalog):
         """Test that empty logical name raises TemplateNotFoundError."""
-        catalog = [
-            TemplateRecord(
-                logical_name_full="summary",
-                relative_path=pathlib.Path("summary.j2"),
-                absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
-            )
-        ]
-
         with pytest.raises(TemplateNotFoundError) as exc_info:
-            resolve_template_name(catalog, "")
+            resolve_template_name(summary_catalog, "")
 
         assert exc_info.value.logical_name == ""
 
-    def test_resolve_logical_name_with_leading_slash(self):
+    def test_resolve_logical_name_with_leading_slash(self, summary_catalog):
         """Test that logical name with leading slash is treated as path-specific."""
-        catalog = [
-            TemplateRecord(
-                logical_name_full="summary",
-                relative_path=pathlib.Path("summary.j2"),
-                absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
-            )
-        ]
-
         # Leading slash should not match "summary"
         with pytest.raises(TemplateNotFoundError):
-            resolve_template_name(catalog, "/summary")
+            resolve_template_name(summary_catalog, "/summary")
 
-    def test_resolve_logical_name_with_trailing_slash(self):
+    def test_resolve_logical_name_with_trailing_slash(self, summary_catalog):
         """Test that logical name with trailing slash doesn't match templates."""
-        catalog = [
-            TemplateRecord(
-                logical_name_full="summary",
-                relative_path=pathlib.Path("summary.j2"),
-                absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
-            )
-        ]
-
         # Trailing slash should not match "summary"
         with pytest.raises(TemplateNotFoundError):
-            resolve_template_name(catalog, "summary/")
+            resolve_template_name(summary_catalog, "summary/")
 
-    def test_resolve_logical_name_with_consecutive_slashes(self):
+    def test_resolve_logical_name_with_consecutive_slashes(self, layout_catalog):
         """Test that logical name with consecutive slashes doesn't match."""
-        catalog = [
-            TemplateRecord(
-                logical_name_full="layout/base",
-                relative_path=pathlib.Path("layout/base.j2"),
-                absolute_path=pathlib.Path("/tmp/templates/layout/base.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
-            )
-        ]
-
         # Double slash should not match
         with pytest.raises(TemplateNotFoundError):
-            resolve_template_name(catalog, "layout//base")
+            resolve_template_name(layout_catalog, "layout//base")
 
-    def test_resolve_logical_name_with_dot_segments(self):
+    def test_resolve_logical_name_with_dot_segments(self, layout_catalog):
         """Test that logical names with . or .. segments don't match."""
-        catalog = [
-            TemplateRecord(
-                logical_name_full="layout/base",
-                relative_path=pathlib.Path("layout/base.j2"),
-                absolute_path=pathlib.Path("/tmp/templates/layout/base.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
-            )
-        ]
-
         # Path traversal attempts should not match
         with pytest.raises(TemplateNotFoundError):
-            resolve_template_name(catalog, "./layout/base")
+            resolve_template_name(layout_catalog, "./layout/base")
 
         with pytest.raises(TemplateNotFoundError):
-            resolve_template_name(catalog, "layout/../layout/base")
+            resolve_template_name(layout_catalog, "layout/../layout/base")
 
-    def test_resolve_logical_name_with_whitespace(self):
+    def test_resolve_logical_name_with_whitespace(self, summary_catalog):
         """Test that logical names with whitespace are treated literally."""
-        catalog = [
-            TemplateRecord(
-                logical_name_full="summary",
-                relative_path=pathlib.Path("summary.j2"),
-                absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
-            )
-        ]
-
         # Leading/trailing whitespace should not match
         with pytest.raises(TemplateNotFoundError):
-            resolve_template_name(catalog, " summary")
+            resolve_template_name(summary_catalog, " summary")
 
         with pytest.raises(TemplateNotFoundError):
-            resolve_template_name(catalog, "summary ")
+            resolve_template_name(summary_catalog, "summary ")
 
-    def test_resolve_logical_name_case_sensitive(self):
+    def test_resolve_logical_name_case_sensitive(self, summary_catalog):
         """Test that logical name resolution is case-sensitive."""
         catalog = [
-            TemplateRecord(
+            dataclasses.replace(
+                summary_catalog[0],
                 logical_name_full="Summary",
                 relative_path=pathlib.Path("Summary.j2"),
                 absolute_path=pathlib.Path("/tmp/templates/Summary.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
             )
         ]
 
@@ -406,23 +369,14 @@ class TestErrorMessageQuality:
         assert "nonexistent/template" in str(exc_info.value)
         assert exc_info.value.logical_name == "nonexistent/template"
 
-    def test_ambiguity_error_includes_candidates(self):
+    def test_ambiguity_error_includes_candidates(self, summary_catalog):
         """Test that TemplateAmbiguityError includes candidate information."""
         catalog = [
-            TemplateRecord(
-                logical_name_full="summary",
-                relative_path=pathlib.Path("summary.j2"),
-                absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
-                tier="project",
-                root_index=0,
-                extension=".j2",
-            ),
-            TemplateRecord(
-                logical_name_full="summary",
+            *summary_catalog,
+            dataclasses.replace(
+                summary_catalog[0],
                 relative_path=pathlib.Path("summary.j2.md"),
                 absolute_path=pathlib.Path("/tmp/templates/summary.j2.md"),
-                tier="project",
-                root_index=0,
                 extension=".j2.md",
             ),
         ]
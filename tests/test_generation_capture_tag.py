@@ -48,3 +48,91 @@ def test_generate_capture_tag_writes_file(tmp_path, monkeypatch):
     generation.generate(config, {}, capture_tag="O_main", output_file=str(output_file))
 
     assert output_file.read_text(encoding="utf-8") == "answer"
+
+
+def test_extract_between_tags_missing_closing_tag():
+    with pytest.raises(GenerationError, match="Closing tag '</O_main>'"):
+        generation.extract_between_tags("<O_main>unterminated", "O_main")
+
+
+def test_extract_between_tags_uses_first_block():
+    text = "<O_main>first</O_main> <O_main>second</O_main>"
+
+    assert generation.extract_between_tags(text, "O_main") == "first"
+
+
+def test_stream_between_tags_handles_tags_split_across_chunks():
+    parts = ["pre <O_", "main>ans", "wer</O_m", "ain> post"]
+    chunks = (SimpleNamespace(text=part) for part in parts)
+    captured: list[str] = []
+
+    generation.stream_between_tags(chunks, "O_main", captured.append)
+
+    assert "".join(captured) == "answer"
+
+
+def test_stream_between_tags_missing_closing_tag():
+    chunks = (SimpleNamespace(text=part) for part in ["<O_main>partial", " answer"])
+
+    with pytest.raises(GenerationError, match="Closing tag"):
+        generation.stream_between_tags(chunks, "O_main", lambda _text: None)
+
+
+def test_generate_capture_tag_missing_tag_leaves_no_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    monkeypatch.setattr(generation, "render_user_instruction", lambda *_: "user")
+    monkeypatch.setattr(generation, "render_system_instruction", lambda *_: None)
+    monkeypatch.setattr(generation.genai, "Client", lambda **_kwargs: object())
+    monkeypatch.setattr(
+        generation,
+        "execute_generation_stream",
+        lambda *_args, **_kwargs: iter([SimpleNamespace(text="<O_main>no end")]),
+    )
+
+    output_file = tmp_path / "capture.txt"
+    with pytest.raises(GenerationError):
+        generation.generate({"model": "m"}, {}, capture_tag="O_main", output_file=str(output_file))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_generate_capture_tag_missing_closing_tag_prints_nothing(monkeypatch, capsys):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    monkeypatch.setattr(generation, "render_user_instruction", lambda *_: "user")
+    monkeypatch.setattr(generation, "render_system_instruction", lambda *_: None)
+    monkeypatch.setattr(generation.genai, "Client", lambda **_kwargs: object())
+    monkeypatch.setattr(
+        generation,
+        "execute_generation_stream",
+        lambda *_args, **_kwargs: iter(
+            [SimpleNamespace(text="<O_main>a long partial"), SimpleNamespace(text=" answer")]
+        ),
+    )
+
+    with pytest.raises(GenerationError, match="Closing tag"):
+        generation.generate({"model": "m"}, {}, capture_tag="O_main")
+
+    assert capsys.readouterr().out == ""
+
+
+def test_generate_capture_tag_writes_through_symlink(tmp_path, monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    monkeypatch.setattr(generation, "render_user_instruction", lambda *_: "user")
+    monkeypatch.setattr(generation, "render_system_instruction", lambda *_: None)
+    monkeypatch.setattr(generation.genai, "Client", lambda **_kwargs: object())
+    monkeypatch.setattr(
+        generation,
+        "execute_generation_stream",
+        lambda *_args, **_kwargs: iter([SimpleNamespace(text="<O_main>answer</O_main>")]),
+    )
+    real_file = tmp_path / "real.txt"
+    real_file.write_text("old", encoding="utf-8")
+    real_file.chmod(0o640)
+    link = tmp_path / "capture.txt"
+    link.symlink_to(real_file)
+
+    generation.generate({"model": "m"}, {}, capture_tag="O_main", output_file=str(link))
+
+    assert link.is_symlink()
+    assert real_file.read_text(encoding="utf-8") == "answer"
+    assert real_file.stat().st_mode & 0o777 == 0o640
@@ -2,10 +2,11 @@
 
 import subprocess
 import sys
-import tempfile
-from pathlib import Path
 
+import pytest
 
+
+@pytest.mark.slow
 def test_cli_help():
     """Test that --help works."""
     result = subprocess.run(
@@ -18,95 +19,53 @@ def test_cli_help():
     assert "available commands" in result.stdout.lower()
 
 
-def test_cli_config_defaults():
-    """Test that 'gai config defaults' works."""
+@pytest.mark.slow
+def test_cli_import_skips_genai_sdk():
+    """Test that loading the CLI does not import google-genai until generation needs it."""
     result = subprocess.run(
-        [sys.executable, "-m", "gai", "config", "defaults"],
+        [sys.executable, "-c", "import sys, gai.__main__; print('google.genai' in sys.modules)"],
         capture_output=True,
         text=True,
     )
     assert result.returncode == 0
-    assert "model" in result.stdout
-    assert "temperature" in result.stdout
+    assert result.stdout.strip() == "False"
 
 
-def test_cli_show_prompt():
+def test_cli_show_prompt(run_cli, tmp_path):
     """Test that 'gai generate --show-prompt' works with template variables."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write("Test document content")
-        temp_path = f.name
-
-    try:
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "gai",
-                "generate",
-                "--show-prompt",
-                "--document",
-                f"@:{temp_path}",
-                "--input",
-                "Test query",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "Test document content" in result.stdout
-        assert "Test query" in result.stdout
-    finally:
-        Path(temp_path).unlink()
-
-
-def test_cli_invalid_temperature():
+    temp_path = tmp_path / "doc.txt"
+    temp_path.write_text("Test document content")
+
+    result = run_cli(["generate", "--show-prompt", "--document", f"@:{temp_path}", "--input", "Test query"])
+    assert result.returncode == 0
+    assert "Test document content" in result.stdout
+    assert "Test query" in result.stdout
+
+
+def test_cli_invalid_temperature(run_cli):
     """Test that invalid temperature raises proper error."""
-    result = subprocess.run(
-        [sys.executable, "-m", "gai", "generate", "--conf-temperature", "not-a-number", "--show-prompt"],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(["generate", "--conf-temperature", "not-a-number", "--show-prompt"])
     assert result.returncode == 1
     assert "Configuration error" in result.stderr or "error" in result.stderr.lower()
 
 
-def test_cli_missing_template_value():
+def test_cli_missing_template_value(run_cli):
     """Test that missing template value raises proper error."""
-    result = subprocess.run(
-        [sys.executable, "-m", "gai", "--show-prompt", "--document"],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(["--show-prompt", "--document"])
     assert result.returncode == 1
     assert "Usage error" in result.stderr or "error" in result.stderr.lower()
 
 
-def test_cli_nonexistent_file():
+def test_cli_nonexistent_file(run_cli):
     """Test that nonexistent file reference raises proper error."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "gai",
-            "generate",
-            "--show-prompt",
-            "--document",
-            "@:/nonexistent/file/path.txt",
-        ],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(["generate", "--show-prompt", "--document", "@:/nonexistent/file/path.txt"])
     assert result.returncode == 1
     assert "error" in result.stderr.lower()
 
 
-def test_cli_unexpected_arg():
+def test_cli_unexpected_arg(run_cli):
     """Test that unexpected argument raises proper error."""
-    result = subprocess.run(
-        [sys.executable, "-m", "gai", "unexpected"],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(["unexpected"])
     # argparse returns exit code 2 for invalid command
     assert result.returncode == 2
     assert "error" in result.stderr.lower()
@@ -9,99 +9,94 @@ from typing import Any
 
 import pytest
 
+from gai import templates
 from gai.generation import prepare_generate_content_config_dict, prepare_prompt_contents
 from gai.templates import render_system_instruction, render_user_instruction
 
-
-@pytest.fixture
-def temp_template_dir(tmp_path: pathlib.Path) -> pathlib.Path:
-    """Create a temporary directory for template files."""
-    template_dir = tmp_path / "templates"
-    template_dir.mkdir()
+# (instruction part, render function) pairs for tests shared by user and system instructions
+INSTRUCTION_PARTS = [("user", render_user_instruction), ("system", render_system_instruction)]
+
+
+# Every template used by this module, by path relative to the template root
+MODULE_TEMPLATES = {
+    "user_greeting.j2": "user template: {{ name }}",
+    "system_greeting.j2": "system template: {{ name }}",
+    "user_msg.j2": "Named: {{ msg }}",
+    "system_msg.j2": "Named System: {{ msg }}",
+    "prompts/user/greeting.j2": "Nested greeting: {{ name }}",
+    "base.j2": "Base: {% block content %}default{% endblock %}",
+    "child.j2": '{% extends "base" %}{% block content %}{{ msg }}{% endblock %}',
+    "header.j2": "Header: {{ title }}",
+    "main.j2": '{% include "header" %}\nBody: {{ content }}',
+    "user_prompt.j2": "Named user: {{ msg }}",
+    "system_prompt.j2": "Named system: {{ role }}",
+}
+
+
+@pytest.fixture(scope="module")
+def temp_template_dir(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Create a template directory holding MODULE_TEMPLATES, shared by the module.
+
+    Writing every template up front keeps the discovered catalog identical across
+    tests, so they all render through the same cached Jinja environment.
+    """
+    template_dir = tmp_path_factory.mktemp("templates")
+    for relative_path, source in MODULE_TEMPLATES.items():
+        template_file = template_dir / relative_path
+        template_file.parent.mkdir(parents=True, exist_ok=True)
+        template_file.write_text(source)
     return template_dir
 
 
+# Config shared by every test; the fixture adds the template root. Tests replace
+# top-level keys on their copy but must not mutate nested values in place.
+_BASE_CFG: dict[str, Any] = {
+    "user-template-paths": None,
+    "builtin-template-paths": None,
+    "system-instruction": "Literal system instruction",
+    "user-instruction": "Literal user instruction",
+    "system-instruction-template": None,
+    "user-instruction-template": None,
+    "temperature": 0.1,
+    "response-mime-type": "text/plain",
+    "max-output-tokens": None,
+    "model": "gemini-flash-latest",
+}
+
+
 @pytest.fixture
 def config_with_template_roots(temp_template_dir: pathlib.Path) -> dict[str, Any]:
     """Create a config with template roots pointing to temp directory."""
-    return {
-        "project-template-paths": [str(temp_template_dir)],
-        "user-template-paths": None,
-        "builtin-template-paths": None,
-        "system-instruction": "Literal system instruction",
-        "user-instruction": "Literal user instruction",
-        "system-instruction-template": None,
-        "user-instruction-template": None,
-        "temperature": 0.1,
-        "response-mime-type": "text/plain",
-        "max-output-tokens": None,
-        "model": "gemini-flash-latest",
-    }
+    return {**_BASE_CFG, "project-template-paths": [str(temp_template_dir)]}
 
 
 class TestNamedTemplateRendering:
     """Tests for named template rendering with the new helper functions."""
 
-    def test_render_user_instruction_with_literal_template(self, config_with_template_roots: dict[str, Any]):
-        """Test that literal user instruction works (backward compatibility)."""
+    @pytest.mark.parametrize(("part", "render"), INSTRUCTION_PARTS)
+    def test_render_instruction_with_literal_template(self, config_with_template_roots: dict[str, Any], part, render):
+        """Test that literal user/system instructions work (backward compatibility)."""
         config = config_with_template_roots
-        config["user-instruction"] = "Hello {{ name }}!"
+        config[f"{part}-instruction"] = "Hello {{ name }}!"
         template_vars = {"name": "World"}
 
-        result = render_user_instruction(config, template_vars)
+        result = render(config, template_vars)
         assert result == "Hello World!"
 
-    def test_render_system_instruction_with_literal_template(self, config_with_template_roots: dict[str, Any]):
-        """Test that literal system instruction works (backward compatibility)."""
-        config = config_with_template_roots
-        config["system-instruction"] = "System: {{ role }}"
-        template_vars = {"role": "assistant"}
-
-        result = render_system_instruction(config, template_vars)
-        assert result == "System: assistant"
-
-    def test_render_user_instruction_with_named_template(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
-        """Test that named user instruction template is resolved and rendered."""
-        # Create a template file
-        template_file = temp_template_dir / "user_greeting.j2"
-        template_file.write_text("Hello {{ name }} from template!")
-
+    @pytest.mark.parametrize(("part", "render"), INSTRUCTION_PARTS)
+    def test_render_instruction_with_named_template(self, config_with_template_roots: dict[str, Any], part, render):
+        """Test that named user/system instruction templates are resolved and rendered."""
         # Configure to use named template
         config = config_with_template_roots
-        config["user-instruction"] = "This should be ignored"
-        config["user-instruction-template"] = "user_greeting"
+        config[f"{part}-instruction"] = "This should be ignored"
+        config[f"{part}-instruction-template"] = f"{part}_greeting"
         template_vars = {"name": "Alice"}
 
-        result = render_user_instruction(config, template_vars)
-        assert result == "Hello Alice from template!"
-
-    def test_render_system_instruction_with_named_template(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
-        """Test that named system instruction template is resolved and rendered."""
-        # Create a template file
-        template_file = temp_template_dir / "system_role.j2"
-        template_file.write_text("System role: {{ role }}")
-
-        # Configure to use named template
-        config = config_with_template_roots
-        config["system-instruction"] = "This should be ignored"
-        config["system-instruction-template"] = "system_role"
-        template_vars = {"role": "expert"}
+        result = render(config, template_vars)
+        assert result == f"{part} template: Alice"
 
-        result = render_system_instruction(config, template_vars)
-        assert result == "System role: expert"
-
-    def test_named_template_precedence_over_literal(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
+    def test_named_template_precedence_over_literal(self, config_with_template_roots: dict[str, Any]):
         """Test that named template takes precedence over literal template."""
-        # Create template files
-        (temp_template_dir / "user_msg.j2").write_text("Named: {{ msg }}")
-        (temp_template_dir / "system_msg.j2").write_text("Named System: {{ msg }}")
-
         config = config_with_template_roots
         config["user-instruction"] = "Literal: {{ msg }}"
         config["user-instruction-template"] = "user_msg"
@@ -115,16 +110,8 @@ class TestNamedTemplateRendering:
         assert user_result == "Named: test"
         assert system_result == "Named System: test"
 
-    def test_named_template_with_nested_path(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
+    def test_named_template_with_nested_path(self, config_with_template_roots: dict[str, Any]):
         """Test that named templates can be resolved from nested directories."""
-        # Create nested directory structure
-        nested_dir = temp_template_dir / "prompts" / "user"
-        nested_dir.mkdir(parents=True)
-        template_file = nested_dir / "greeting.j2"
-        template_file.write_text("Nested greeting: {{ name }}")
-
         config = config_with_template_roots
         config["user-instruction-template"] = "prompts/user/greeting"
         template_vars = {"name": "Bob"}
@@ -132,18 +119,8 @@ class TestNamedTemplateRendering:
         result = render_user_instruction(config, template_vars)
         assert result == "Nested greeting: Bob"
 
-    def test_named_template_with_extends(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
+    def test_named_template_with_extends(self, config_with_template_roots: dict[str, Any]):
         """Test that named templates can use {% extends %} for composition."""
-        # Create base template
-        base_template = temp_template_dir / "base.j2"
-        base_template.write_text("Base: {% block content %}default{% endblock %}")
-
-        # Create child template
-        child_template = temp_template_dir / "child.j2"
-        child_template.write_text('{% extends "base" %}{% block content %}{{ msg }}{% endblock %}')
-
         config = config_with_template_roots
         config["user-instruction-template"] = "child"
         template_vars = {"msg": "extended content"}
@@ -151,18 +128,8 @@ class TestNamedTemplateRendering:
         result = render_user_instruction(config, template_vars)
         assert result == "Base: extended content"
 
-    def test_named_template_with_include(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
+    def test_named_template_with_include(self, config_with_template_roots: dict[str, Any]):
         """Test that named templates can use {% include %} for composition."""
-        # Create partial template
-        partial = temp_template_dir / "header.j2"
-        partial.write_text("Header: {{ title }}")
-
-        # Create main template
-        main_template = temp_template_dir / "main.j2"
-        main_template.write_text('{% include "header" %}\nBody: {{ content }}')
-
         config = config_with_template_roots
         config["user-instruction-template"] = "main"
         template_vars = {"title": "Welcome", "content": "Hello"}
@@ -185,6 +152,21 @@ class TestNamedTemplateRendering:
         assert user_result is None
         assert system_result is None
 
+    def test_named_templates_share_one_environment(self, config_with_template_roots: dict[str, Any], monkeypatch):
+        """Test that renders against the shared template directory reuse one Jinja environment."""
+        config = config_with_template_roots
+        config["user-instruction-template"] = "user_msg"
+        config["system-instruction-template"] = "system_msg"
+        render_user_instruction(config, {"msg": "warm"})
+
+        def fail_create(*_args, **_kwargs):
+            raise AssertionError("unexpected Jinja environment construction")
+
+        monkeypatch.setattr(templates, "create_jinja_env_from_catalog", fail_create)
+
+        assert render_user_instruction(config, {"msg": "again"}) == "Named: again"
+        assert render_system_instruction(config, {"msg": "again"}) == "Named System: again"
+
 
 class TestGenerationIntegration:
     """Tests for integration with generation.py functions."""
@@ -202,13 +184,8 @@ class TestGenerationIntegration:
         assert len(contents[0].parts) == 1
         assert contents[0].parts[0].text == "User message: test"
 
-    def test_prepare_prompt_contents_with_named_template(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
+    def test_prepare_prompt_contents_with_named_template(self, config_with_template_roots: dict[str, Any]):
         """Test prepare_prompt_contents with named template."""
-        # Create template
-        (temp_template_dir / "user_prompt.j2").write_text("Named user: {{ msg }}")
-
         config = config_with_template_roots
         config["user-instruction-template"] = "user_prompt"
         template_vars = {"msg": "hello"}
@@ -230,13 +207,8 @@ class TestGenerationIntegration:
         assert result["temperature"] == 0.1
         assert result["response_mime_type"] == "text/plain"
 
-    def test_prepare_generate_content_config_dict_with_named_template(
-        self, config_with_template_roots: dict[str, Any], temp_template_dir: pathlib.Path
-    ):
+    def test_prepare_generate_content_config_dict_with_named_template(self, config_with_template_roots: dict[str, Any]):
         """Test prepare_generate_content_config_dict with named template."""
-        # Create template
-        (temp_template_dir / "system_prompt.j2").write_text("Named system: {{ role }}")
-
         config = config_with_template_roots
         config["system-instruction-template"] = "system_prompt"
         template_vars = {"role": "expert"}
@@ -1,14 +1,20 @@
 """Tests for template catalog and discovery."""
 
+import dataclasses
+import os
 import pathlib
+import sys
 
 import pytest
 
+from gai import template_catalog
 from gai.template_catalog import (
     DEFAULT_TEMPLATE_EXTENSIONS,
     TIER_PRECEDENCE,
     TemplateCatalog,
     TemplateRecord,
+    _listing_cache,
+    clear_discovery_cache,
     discover_templates,
 )
 
@@ -54,6 +60,46 @@ class TestTemplateRecord:
                 extension="j2",  # Missing dot
             )
 
+    def test_record_is_immutable_and_hashable(self):
+        """Test that records are frozen and usable as dict/set keys."""
+        record = TemplateRecord(
+            logical_name_full="summary",
+            relative_path=pathlib.Path("summary.j2"),
+            absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
+            tier="project",
+            root_index=0,
+            extension=".j2",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.tier = "user"  # type: ignore[misc]
+        assert dataclasses.replace(record) in {record}
+
+    def test_record_tier_rank_follows_tier(self):
+        """Test tier_rank is derived from the tier and kept in sync by replace()."""
+        record = TemplateRecord(
+            logical_name_full="summary",
+            relative_path=pathlib.Path("summary.j2"),
+            absolute_path=pathlib.Path("/tmp/templates/summary.j2"),
+            tier="project",
+            root_index=0,
+            extension=".j2",
+        )
+        assert record.tier_rank == TIER_PRECEDENCE["project"]
+        assert dataclasses.replace(record, tier="builtin").tier_rank == TIER_PRECEDENCE["builtin"]
+
+    def test_record_interns_tier_and_extension(self):
+        """Test tier and extension built at runtime share the canonical strings."""
+        record = TemplateRecord(
+            logical_name_full="summary",
+            relative_path=pathlib.Path("summary.j2.md"),
+            absolute_path=pathlib.Path("/tmp/templates/summary.j2.md"),
+            tier="PROJECT".lower(),  # type: ignore[arg-type]
+            root_index=0,
+            extension=".J2.MD".lower(),
+        )
+        assert record.tier is next(tier for tier in TIER_PRECEDENCE if tier == "project")
+        assert record.extension is sys.intern(".j2.md")
+
 
 class TestDiscoverTemplates:
     """Tests for template discovery function."""
@@ -86,12 +132,10 @@ class TestDiscoverTemplates:
         assert record.root_index == 0
         assert record.extension == ".j2"
 
-    def test_discover_multiple_extensions(self, tmp_path):
+    def test_discover_multiple_extensions(self, mktemplates):
         """Test discovery with different template extensions."""
-        template_dir = tmp_path / "templates"
-        template_dir.mkdir()
-        (template_dir / "file1.j2").write_text("Content")
-        (template_dir / "file2.j2.md").write_text("Content")
+        base = mktemplates({"templates/file1.j2": "Content", "templates/file2.j2.md": "Content"})
+        template_dir = base / "templates"
 
         records = discover_templates([template_dir], [], [])
 
@@ -99,14 +143,10 @@ class TestDiscoverTemplates:
         assert records[0].extension == ".j2"
         assert records[1].extension == ".j2.md"
 
-    def test_discover_nested_directories(self, tmp_path):
+    def test_discover_nested_directories(self, mktemplates):
         """Test discovery in nested directory structure."""
-        template_dir = tmp_path / "templates"
-        layout_dir = template_dir / "layout"
-        layout_dir.mkdir(parents=True)
-
-        (template_dir / "summary.j2").write_text("Content")
-        (layout_dir / "base.j2").write_text("Content")
+        base = mktemplates({"templates/summary.j2": "Content", "templates/layout/base.j2": "Content"})
+        template_dir = base / "templates"
 
         records = discover_templates([template_dir], [], [])
 
@@ -115,28 +155,27 @@ class TestDiscoverTemplates:
         assert records[0].logical_name_full == "layout/base"
         assert records[1].logical_name_full == "summary"
 
-    def test_discover_ignore_non_template_files(self, tmp_path):
+    def test_discover_ignore_non_template_files(self, mktemplates):
         """Test that non-template files are ignored."""
-        template_dir = tmp_path / "templates"
-        template_dir.mkdir()
-        (template_dir / "template.j2").write_text("Content")
-        (template_dir / "readme.txt").write_text("Not a template")
-        (template_dir / "config.yaml").write_text("Not a template")
+        base = mktemplates(
+            {
+                "templates/template.j2": "Content",
+                "templates/readme.txt": "Not a template",
+                "templates/config.yaml": "Not a template",
+            }
+        )
+        template_dir = base / "templates"
 
         records = discover_templates([template_dir], [], [])
 
         assert len(records) == 1
         assert records[0].logical_name_full == "template"
 
-    def test_discover_multiple_roots_same_tier(self, tmp_path):
+    def test_discover_multiple_roots_same_tier(self, mktemplates):
         """Test discovery with multiple roots in the same tier."""
-        root1 = tmp_path / "root1"
-        root2 = tmp_path / "root2"
-        root1.mkdir()
-        root2.mkdir()
-
-        (root1 / "file1.j2").write_text("Content")
-        (root2 / "file2.j2").write_text("Content")
+        base = mktemplates({"root1/file1.j2": "Content", "root2/file2.j2": "Content"})
+        root1 = base / "root1"
+        root2 = base / "root2"
 
         records = discover_templates([root1, root2], [], [])
 
@@ -205,6 +244,18 @@ class TestDiscoverTemplates:
         assert len(records) == 1
         assert records[0].extension == ".txt"
 
+    def test_discover_overlapping_extensions_prefers_longest(self, tmp_path):
+        """Test that the most specific extension wins when several match."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "note.j2.md").write_text("Content")
+
+        records = discover_templates([template_dir], [], [], allowed_extensions=(".md", ".j2.md"))
+
+        assert len(records) == 1
+        assert records[0].extension == ".j2.md"
+        assert records[0].logical_name_full == "note"
+
     def test_discover_ordering_within_tier(self, tmp_path):
         """Test that templates within a tier are ordered by root_index then path."""
         root1 = tmp_path / "root1"
@@ -229,6 +280,68 @@ class TestDiscoverTemplates:
         assert records[2].logical_name_full == "beta"
         assert records[2].root_index == 1
 
+    def test_discover_reuses_listing_until_directory_changes(self, tmp_path, monkeypatch):
+        """Test unchanged directories are served from the listing cache."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "summary.j2").write_text("Content")
+        # Age the directory past the racy window so its listing is cached
+        os.utime(template_dir, ns=(0, 0))
+
+        clear_discovery_cache()
+        assert [r.logical_name_full for r in discover_templates([template_dir], [], [])] == ["summary"]
+
+        scanned = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: scanned.append(path) or real_scandir(path))
+
+        assert [r.logical_name_full for r in discover_templates([template_dir], [], [])] == ["summary"]
+        assert scanned == []
+
+        (template_dir / "extra.j2").write_text("Content")
+        assert [r.logical_name_full for r in discover_templates([template_dir], [], [])] == ["extra", "summary"]
+        assert scanned == [str(template_dir)]
+
+        clear_discovery_cache()
+
+    def test_listing_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test the listing cache evicts the oldest directory once full."""
+        monkeypatch.setattr(template_catalog, "_LISTING_CACHE_SIZE", 2)
+        roots = []
+        for name in ("a", "b", "c"):
+            root = tmp_path / name
+            root.mkdir()
+            (root / f"{name}.j2").write_text("Content")
+            os.utime(root, ns=(0, 0))
+            roots.append(root)
+
+        clear_discovery_cache()
+        for root in roots:
+            discover_templates([root], [], [])
+
+        assert list(_listing_cache) == [str(roots[1]), str(roots[2])]
+
+        clear_discovery_cache()
+
+    def test_discover_sees_changes_in_nested_directories(self, tmp_path):
+        """Test cached discovery results are invalidated by changes below the root."""
+        template_dir = tmp_path / "templates"
+        nested_dir = template_dir / "prompts"
+        nested_dir.mkdir(parents=True)
+        (nested_dir / "summary.j2").write_text("Content")
+        for directory in (nested_dir, template_dir):
+            os.utime(directory, ns=(0, 0))
+
+        clear_discovery_cache()
+        first = discover_templates([template_dir], [], [])
+        assert discover_templates([template_dir], [], []) == first
+
+        (nested_dir / "extra.j2").write_text("Content")
+        names = [r.logical_name_full for r in discover_templates([template_dir], [], [])]
+        assert names == ["prompts/extra", "prompts/summary"]
+
+        clear_discovery_cache()
+
 
 class TestTemplateCatalog:
     """Tests for TemplateCatalog class."""
@@ -289,6 +402,21 @@ class TestTemplateCatalog:
         names = [record.logical_name_full for record in catalog]
         assert names == ["a", "b"]
 
+    def test_catalog_is_hashable_by_contents(self, tmp_path):
+        """Test catalogs over the same records compare and hash equal."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "a.j2").write_text("Content")
+
+        records = discover_templates([template_dir], [], [])
+        catalog = TemplateCatalog(records)
+        records.clear()
+
+        assert catalog.records == tuple(discover_templates([template_dir], [], []))
+        assert catalog == TemplateCatalog(catalog.records)
+        assert hash(catalog) == hash(TemplateCatalog(catalog.records))
+        assert catalog != TemplateCatalog([])
+
 
 class TestTierPrecedence:
     """Tests for tier precedence constants."""
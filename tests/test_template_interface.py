@@ -1,7 +1,10 @@
+import textwrap
 from pathlib import Path
 
-import textwrap
+import pytest
 
+from gai.exceptions import TemplateAmbiguityError
+from gai.template_catalog import build_template_catalog
 from gai.template_interface import build_template_interface
 
 
@@ -52,3 +55,47 @@ def test_build_template_interface_handles_empty_sections(tmp_path):
     assert interface.mechanisms == {}
     assert interface.outputs == set()
     assert interface.other_variables == set()
+
+
+def test_build_template_interface_probes_path_specific_names(tmp_path, monkeypatch):
+    template_root = tmp_path / "templates"
+    (template_root / "prompts").mkdir(parents=True)
+    (template_root / "prompts" / "sample.j2").write_text("{{ I_document }}")
+
+    def fail_discovery(_config):
+        raise AssertionError("path-specific names should not need full discovery")
+
+    monkeypatch.setattr("gai.template_catalog.build_template_catalog", fail_discovery)
+
+    interface = build_template_interface(_base_config(template_root), "prompts/sample")
+
+    assert interface.inputs == {"I_document": "document"}
+
+
+def test_build_template_interface_reports_ambiguous_path_specific_names(tmp_path):
+    template_root = tmp_path / "templates"
+    (template_root / "prompts").mkdir(parents=True)
+    (template_root / "prompts" / "sample.j2").write_text("plain")
+    (template_root / "prompts" / "sample.j2.md").write_text("markdown")
+
+    with pytest.raises(TemplateAmbiguityError):
+        build_template_interface(_base_config(template_root), "prompts/sample")
+
+
+def test_build_template_interface_probe_matches_discovery(tmp_path, monkeypatch):
+    template_root = tmp_path / "templates"
+    (template_root / "prompts").mkdir(parents=True)
+    (template_root / "prompts" / "x.md").write_text("{{ I_plain }}")
+    (template_root / "prompts" / "x.j2.md").write_text("{{ I_markdown }}")
+    config = _base_config(template_root)
+    discovered = build_template_catalog(config).records
+
+    def fail_discovery(_config):
+        raise AssertionError("path-specific names should not need full discovery")
+
+    monkeypatch.setattr("gai.template_catalog.build_template_catalog", fail_discovery)
+
+    for name in ("prompts/x", "prompts/x.j2.md"):
+        probed = build_template_interface(config, name)
+        assert probed == build_template_interface(config, name, catalog=discovered)
+        assert probed.inputs == {"I_markdown": "markdown"}
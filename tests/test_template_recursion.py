@@ -5,39 +5,18 @@ each other, and that variables are properly expanded across all nesting levels.
 """
 
 import pathlib
+import shutil
 
 import pytest
 
 from gai.exceptions import TemplateError, TemplateNotFoundError
 from gai.templates import render_system_instruction, render_user_instruction
 
+from . import _fs
 
-@pytest.fixture
-def template_fixtures(tmp_path: pathlib.Path) -> dict[str, pathlib.Path]:
-    """Create a temporary template directory structure for testing recursion.
-
-    Creates the following structure:
-        <tmp>/.gai/templates/
-          layout/
-            base_conversation.j2
-          partials/
-            output_format.j2
-            greeting.j2
-          prompts/
-            nested_include.j2
-            nested_extends.j2
-            double_nested.j2
-    """
-    templates_root = tmp_path / ".gai" / "templates"
-    templates_root.mkdir(parents=True)
-
-    # Create layout directory and base template
-    layout_dir = templates_root / "layout"
-    layout_dir.mkdir()
-
-    base_conversation = layout_dir / "base_conversation.j2"
-    base_conversation.write_text(
-        """You are {{ role }}.
+# Templates shared by the module, by path relative to the template root
+RECURSION_TEMPLATES = {
+    "layout/base_conversation.j2": """You are {{ role }}.
 
 {% block task %}
 [base task]
@@ -46,48 +25,20 @@ def template_fixtures(tmp_path: pathlib.Path) -> dict[str, pathlib.Path]:
 {% block signature %}
 -- End of instruction --
 {% endblock %}""",
-        encoding="utf-8",
-    )
-
-    # Create partials directory
-    partials_dir = templates_root / "partials"
-    partials_dir.mkdir()
-
-    output_format = partials_dir / "output_format.j2"
-    output_format.write_text(
-        """Output format:
+    "partials/output_format.j2": """Output format:
 - variable: {{ important_var }}
 - context: {{ context_var }}""",
-        encoding="utf-8",
-    )
-
-    greeting = partials_dir / "greeting.j2"
-    greeting.write_text(
-        """Hello {{ username }}!""",
-        encoding="utf-8",
-    )
-
-    # Create prompts directory
-    prompts_dir = templates_root / "prompts"
-    prompts_dir.mkdir()
-
-    # Template that extends base and includes a partial
-    nested_include = prompts_dir / "nested_include.j2"
-    nested_include.write_text(
-        """{% extends "layout/base_conversation" %}
+    "partials/greeting.j2": """Hello {{ username }}!""",
+    # Extends base and includes a partial
+    "prompts/nested_include.j2": """{% extends "layout/base_conversation" %}
 
 {% block task %}
 This is a nested task for {{ subject }}.
 
 {% include "partials/output_format" %}
 {% endblock %}""",
-        encoding="utf-8",
-    )
-
-    # Template that extends base with different blocks
-    nested_extends = prompts_dir / "nested_extends.j2"
-    nested_extends.write_text(
-        """{% extends "layout/base_conversation" %}
+    # Extends base with different blocks
+    "prompts/nested_extends.j2": """{% extends "layout/base_conversation" %}
 
 {% block task %}
 Working on: {{ task_name }}
@@ -96,13 +47,8 @@ Working on: {{ task_name }}
 {% block signature %}
 Signed by {{ author }}
 {% endblock %}""",
-        encoding="utf-8",
-    )
-
-    # Template that includes multiple partials
-    double_nested = prompts_dir / "double_nested.j2"
-    double_nested.write_text(
-        """{% extends "layout/base_conversation" %}
+    # Includes multiple partials
+    "prompts/double_nested.j2": """{% extends "layout/base_conversation" %}
 
 {% block task %}
 {% include "partials/greeting" %}
@@ -110,21 +56,57 @@ Signed by {{ author }}
 Task details for {{ subject }}:
 {% include "partials/output_format" %}
 {% endblock %}""",
-        encoding="utf-8",
-    )
+}
+
 
+def _template_dirs(templates_root: pathlib.Path) -> dict[str, pathlib.Path]:
     return {
         "root": templates_root,
-        "layout_dir": layout_dir,
-        "partials_dir": partials_dir,
-        "prompts_dir": prompts_dir,
+        "layout_dir": templates_root / "layout",
+        "partials_dir": templates_root / "partials",
+        "prompts_dir": templates_root / "prompts",
     }
 
 
-def test_simple_include_recursion(template_fixtures: dict[str, pathlib.Path]):
+@pytest.fixture(scope="module")
+def shared_template_fixtures(tmp_path_factory: pytest.TempPathFactory) -> dict[str, pathlib.Path]:
+    """Create a temporary template directory structure for testing recursion.
+
+    Written once per module and read-only: every test rendering from it sees the same
+    catalog, so its compiled templates are reused across tests. Tests adding templates
+    use template_fixtures instead.
+
+    Creates the following structure:
+        <tmp>/.gai/templates/
+          layout/
+            base_conversation.j2
+          partials/
+            output_format.j2
+            greeting.j2
+          prompts/
+            nested_include.j2
+            nested_extends.j2
+            double_nested.j2
+    """
+    templates_root = tmp_path_factory.mktemp("recursion") / ".gai" / "templates"
+    _fs.write_all(templates_root, RECURSION_TEMPLATES)
+    return _template_dirs(templates_root)
+
+
+@pytest.fixture
+def template_fixtures(
+    shared_template_fixtures: dict[str, pathlib.Path], tmp_path: pathlib.Path
+) -> dict[str, pathlib.Path]:
+    """A private, writable copy of the shared template structure."""
+    templates_root = tmp_path / ".gai" / "templates"
+    shutil.copytree(shared_template_fixtures["root"], templates_root)
+    return _template_dirs(templates_root)
+
+
+def test_simple_include_recursion(shared_template_fixtures: dict[str, pathlib.Path]):
     """Test that a template can include another template and expand variables."""
     config = {
-        "project-template-paths": [str(template_fixtures["root"])],
+        "project-template-paths": [str(shared_template_fixtures["root"])],
         "user-template-paths": [],
         "builtin-template-paths": [],
         "user-instruction-template": "prompts/nested_include",
@@ -149,10 +131,10 @@ def test_simple_include_recursion(template_fixtures: dict[str, pathlib.Path]):
     assert "-- End of instruction --" in result
 
 
-def test_extends_with_blocks(template_fixtures: dict[str, pathlib.Path]):
+def test_extends_with_blocks(shared_template_fixtures: dict[str, pathlib.Path]):
     """Test that template extension works with block overrides."""
     config = {
-        "project-template-paths": [str(template_fixtures["root"])],
+        "project-template-paths": [str(shared_template_fixtures["root"])],
         "user-template-paths": [],
         "builtin-template-paths": [],
         "system-instruction-template": "prompts/nested_extends",
@@ -173,10 +155,10 @@ def test_extends_with_blocks(template_fixtures: dict[str, pathlib.Path]):
     assert "[base task]" not in result  # Should be overridden
 
 
-def test_multiple_includes(template_fixtures: dict[str, pathlib.Path]):
+def test_multiple_includes(shared_template_fixtures: dict[str, pathlib.Path]):
     """Test that a template can include multiple partials."""
     config = {
-        "project-template-paths": [str(template_fixtures["root"])],
+        "project-template-paths": [str(shared_template_fixtures["root"])],
         "user-template-paths": [],
         "builtin-template-paths": [],
         "user-instruction-template": "prompts/double_nested",
@@ -200,10 +182,10 @@ def test_multiple_includes(template_fixtures: dict[str, pathlib.Path]):
     assert "VAR2" in result
 
 
-def test_missing_variable_in_nested_template(template_fixtures: dict[str, pathlib.Path]):
+def test_missing_variable_in_nested_template(shared_template_fixtures: dict[str, pathlib.Path]):
     """Test that missing variables in nested templates raise proper errors."""
     config = {
-        "project-template-paths": [str(template_fixtures["root"])],
+        "project-template-paths": [str(shared_template_fixtures["root"])],
         "user-template-paths": [],
         "builtin-template-paths": [],
         "user-instruction-template": "prompts/nested_include",
@@ -255,10 +237,10 @@ def test_nonexistent_included_template(template_fixtures: dict[str, pathlib.Path
         render_user_instruction(config, template_vars)
 
 
-def test_system_instruction_with_recursion(template_fixtures: dict[str, pathlib.Path]):
+def test_system_instruction_with_recursion(shared_template_fixtures: dict[str, pathlib.Path]):
     """Test that system-instruction-template supports recursion."""
     config = {
-        "project-template-paths": [str(template_fixtures["root"])],
+        "project-template-paths": [str(shared_template_fixtures["root"])],
         "user-template-paths": [],
         "builtin-template-paths": [],
         "system-instruction-template": "prompts/nested_include",
@@ -280,12 +262,12 @@ def test_system_instruction_with_recursion(template_fixtures: dict[str, pathlib.
     assert "SYS_CONTEXT" in result
 
 
-def test_extensionless_template_names(template_fixtures: dict[str, pathlib.Path]):
+def test_extensionless_template_names(shared_template_fixtures: dict[str, pathlib.Path]):
     """Test that extensionless logical names work for nested includes."""
     # This test verifies that {% include "partials/output_format" %} works
     # without needing to specify .j2 extension
     config = {
-        "project-template-paths": [str(template_fixtures["root"])],
+        "project-template-paths": [str(shared_template_fixtures["root"])],
         "user-template-paths": [],
         "builtin-template-paths": [],
         "user-instruction-template": "prompts/nested_include",
@@ -10,19 +10,18 @@ import pytest
 
 from gai.templates import render_user_instruction
 
+from . import _fs
 
-@pytest.fixture
-def simple_template(tmp_path: pathlib.Path) -> dict[str, pathlib.Path]:
-    """Create a simple template for testing variable rendering."""
-    templates_root = tmp_path / ".gai" / "templates"
-    templates_root.mkdir(parents=True)
-
-    simple = templates_root / "simple.j2"
-    simple.write_text(
-        """Subject: {{ subject }}
-Document: {{ doc }}""",
-        encoding="utf-8",
-    )
+
+@pytest.fixture(scope="module")
+def simple_template(tmp_path_factory: pytest.TempPathFactory) -> dict[str, pathlib.Path]:
+    """Create a simple template for testing variable rendering.
+
+    Shared by the module and never modified, so every test renders through the same
+    cached environment and the template is compiled once.
+    """
+    templates_root = tmp_path_factory.mktemp("escaping") / ".gai" / "templates"
+    _fs.write_all(templates_root, {"simple.j2": "Subject: {{ subject }}\nDocument: {{ doc }}"})
 
     return {
         "root": templates_root,
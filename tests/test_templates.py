@@ -1,9 +1,11 @@
 """Tests for template module."""
 
+import os
+
 import pytest
 
 from gai.exceptions import TemplateError
-from gai.templates import render_template_string
+from gai.templates import _compile_template_string, render_template_string
 
 
 def test_render_template_string_simple():
@@ -71,3 +73,38 @@ def test_render_template_string_syntax_error():
 
     with pytest.raises(TemplateError):
         render_template_string(template, variables, "test")
+
+
+def test_render_template_string_reuses_compiled_template():
+    """Test that repeated renders of the same source skip recompilation."""
+    template = "Cached {{ name }}"
+
+    assert render_template_string(template, {"name": "one"}, "test") == "Cached one"
+    hits_before = _compile_template_string.cache_info().hits
+    assert render_template_string(template, {"name": "two"}, "test") == "Cached two"
+
+    assert _compile_template_string.cache_info().hits == hits_before + 1
+
+
+def test_render_template_string_rereads_included_files(tmp_path, monkeypatch):
+    """Test that a literal template including a file sees later edits to it."""
+    monkeypatch.chdir(tmp_path)
+    included = tmp_path / "inc.txt"
+    included.write_text("A")
+    template = '{% include "inc.txt" %}'
+
+    assert render_template_string(template, {}, "test") == "A"
+    included.write_text("B")
+    os.utime(included, ns=(0, 0))
+
+    assert render_template_string(template, {}, "test") == "B"
+
+
+def test_render_template_string_renders_container_values_every_time():
+    """Test that renders see the current contents of mutable variable values."""
+    template = "Items {{ items | join(',') }}"
+    items = ["a"]
+
+    assert render_template_string(template, {"items": items}, "test") == "Items a"
+    items.append("b")
+    assert render_template_string(template, {"items": items}, "test") == "Items a,b"
@@ -1,5 +1,6 @@
 """Tests for template resolution logic."""
 
+import os
 import pathlib
 
 import jinja2
@@ -7,7 +8,15 @@ import pytest
 
 from gai.exceptions import TemplateAmbiguityError, TemplateNotFoundError
 from gai.template_catalog import TemplateRecord
-from gai.templates import CatalogLoader, create_jinja_env_from_catalog, resolve_template_name
+from gai.templates import (
+    CatalogLoader,
+    _CatalogIndex,
+    _environment_fingerprint,
+    _LazyBytecodeCache,
+    create_jinja_env_from_catalog,
+    get_environment,
+    resolve_template_name,
+)
 
 
 class TestResolveTemplateName:
@@ -91,6 +100,22 @@ class TestResolveTemplateName:
         result = resolve_template_name(catalog, "summary.j2.md")
         assert result.extension == ".j2.md"
 
+    def test_resolve_explicit_extension_prefers_longest_match(self):
+        """Test that a compound extension wins over a shorter suffix listed before it."""
+        catalog = [
+            TemplateRecord(
+                logical_name_full="summary",
+                relative_path=pathlib.Path("summary.j2.md"),
+                absolute_path=pathlib.Path("/tmp/templates/summary.j2.md"),
+                tier="project",
+                root_index=0,
+                extension=".j2.md",
+            ),
+        ]
+
+        result = resolve_template_name(catalog, "summary.j2.md", allowed_extensions=(".md", ".j2.md"))
+        assert result.extension == ".j2.md"
+
     def test_resolve_tier_precedence_project_wins(self):
         """Test that project tier takes precedence over user tier."""
         catalog = [
@@ -320,6 +345,34 @@ class TestResolveTemplateName:
 
         assert exc_info.value.tier == "user"
 
+    def test_resolve_with_prebuilt_index(self):
+        """Test that a prebuilt catalog index resolves like the plain record list."""
+        catalog = [
+            TemplateRecord(
+                logical_name_full="email/summary",
+                relative_path=pathlib.Path("email/summary.j2"),
+                absolute_path=pathlib.Path("/tmp/user/email/summary.j2"),
+                tier="user",
+                root_index=0,
+                extension=".j2",
+            ),
+            TemplateRecord(
+                logical_name_full="summary",
+                relative_path=pathlib.Path("summary.j2"),
+                absolute_path=pathlib.Path("/tmp/project/summary.j2"),
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            ),
+        ]
+        index = _CatalogIndex.from_records(catalog)
+
+        assert resolve_template_name(index, "summary") is catalog[1]
+        assert resolve_template_name(index, "email/summary") is catalog[0]
+        with pytest.raises(TemplateNotFoundError) as exc_info:
+            resolve_template_name(index, "missing")
+        assert exc_info.value.searched_roots == ["/tmp/project", "/tmp/user/email"]
+
 
 class TestCatalogLoader:
     """Tests for CatalogLoader integration with Jinja2."""
@@ -352,6 +405,176 @@ class TestCatalogLoader:
         assert callable(uptodate)
         assert uptodate() is True
 
+    def test_loader_resolves_each_name_once(self, tmp_path, monkeypatch):
+        """Test that repeated loads of a name reuse the first resolution."""
+        from gai import templates
+
+        template_file = tmp_path / "summary.j2"
+        template_file.write_text("Hello")
+        catalog = [
+            TemplateRecord(
+                logical_name_full="summary",
+                relative_path=pathlib.Path("summary.j2"),
+                absolute_path=template_file,
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            )
+        ]
+        loader = CatalogLoader(catalog)
+        env = jinja2.Environment(loader=loader)
+        assert loader.get_source(env, "summary")[0] == "Hello"
+
+        def fail_resolve(*_args, **_kwargs):
+            raise AssertionError("resolve_template_name should not be called again")
+
+        monkeypatch.setattr(templates, "resolve_template_name", fail_resolve)
+        assert loader.get_source(env, "summary")[0] == "Hello"
+
+    def test_loaders_share_unchanged_sources(self, tmp_path, monkeypatch):
+        """Test that a new loader reuses an earlier read until the file changes."""
+        template_file = tmp_path / "summary.j2"
+        template_file.write_text("First")
+        os.utime(template_file, ns=(0, 0))  # Old enough to be cached
+        catalog = [
+            TemplateRecord(
+                logical_name_full="summary",
+                relative_path=pathlib.Path("summary.j2"),
+                absolute_path=template_file,
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            )
+        ]
+        env = jinja2.Environment()
+        assert CatalogLoader(catalog).get_source(env, "summary")[0] == "First"
+
+        with monkeypatch.context() as m:
+            m.setattr("gai.template_catalog.os.open", lambda *_args, **_kwargs: pytest.fail("source was read again"))
+            assert CatalogLoader(catalog).get_source(env, "summary")[0] == "First"
+
+        template_file.write_text("Second, longer")
+        assert CatalogLoader(catalog).get_source(env, "summary")[0] == "Second, longer"
+
+    def test_loader_remembers_missing_names(self, monkeypatch):
+        """Test that a failed lookup is not repeated until the cache is cleared."""
+        from gai import templates
+
+        loader = CatalogLoader([])
+        env = jinja2.Environment(loader=loader)
+        calls = []
+        resolve = templates.resolve_template_name
+
+        def counting_resolve(*args, **kwargs):
+            calls.append(args[1])
+            return resolve(*args, **kwargs)
+
+        monkeypatch.setattr(templates, "resolve_template_name", counting_resolve)
+
+        for _ in range(2):
+            with pytest.raises(jinja2.TemplateNotFound) as exc_info:
+                loader.get_source(env, "missing")
+            assert isinstance(exc_info.value.__cause__, TemplateNotFoundError)
+        assert calls == ["missing"]
+
+        loader.clear_cache()
+        with pytest.raises(jinja2.TemplateNotFound):
+            loader.get_source(env, "missing")
+        assert calls == ["missing", "missing"]
+
+    def test_loader_lists_logical_names(self):
+        """Test that the loader lists each logical name once, sorted."""
+
+        def make_record(name, tier, extension):
+            return TemplateRecord(
+                logical_name_full=name,
+                relative_path=pathlib.Path(f"{name}{extension}"),
+                absolute_path=pathlib.Path(f"/{tier}/{name}{extension}"),
+                tier=tier,
+                root_index=0,
+                extension=extension,
+            )
+
+        catalog = [
+            make_record("summary", "user", ".j2"),
+            make_record("layout/base", "project", ".j2"),
+            make_record("summary", "project", ".j2.md"),
+        ]
+
+        env = jinja2.Environment(loader=CatalogLoader(catalog))
+
+        assert env.list_templates() == ["layout/base", "summary"]
+
+    def test_loader_defers_catalog_factory_until_first_lookup(self, tmp_path):
+        """Test that a catalog factory runs once, when the first template is requested."""
+        template_file = tmp_path / "summary.j2"
+        template_file.write_text("Hello")
+        calls = []
+
+        def discover():
+            calls.append(1)
+            return [
+                TemplateRecord(
+                    logical_name_full="summary",
+                    relative_path=pathlib.Path("summary.j2"),
+                    absolute_path=template_file,
+                    tier="project",
+                    root_index=0,
+                    extension=".j2",
+                )
+            ]
+
+        env = create_jinja_env_from_catalog(discover)
+        assert calls == []
+
+        assert env.get_template("summary").render() == "Hello"
+        assert env.list_templates() == ["summary"]
+        assert calls == [1]
+
+    def test_loader_compiles_each_file_once(self, tmp_path):
+        """Test that every name resolving to one file shares its compiled template."""
+        (tmp_path / "email").mkdir()
+        template_file = tmp_path / "email" / "summary.j2"
+        template_file.write_text("Hello {{ name }}")
+        catalog = [
+            TemplateRecord(
+                logical_name_full="email/summary",
+                relative_path=pathlib.Path("email/summary.j2"),
+                absolute_path=template_file,
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            )
+        ]
+        env = create_jinja_env_from_catalog(catalog)
+
+        template = env.get_template("summary")
+
+        assert env.get_template("summary.j2") is template
+        assert env.get_template("email/summary") is template
+        assert template.render(name="A") == "Hello A"
+
+    def test_includes_share_one_cache_entry_per_file(self, tmp_path):
+        """Test that extends/include references by different names reuse one cached template."""
+        (tmp_path / "email").mkdir()
+        (tmp_path / "email" / "summary.j2").write_text("[{{ name }}]")
+        (tmp_path / "main.j2").write_text('{% include "summary" %}{% include "email/summary.j2" %}')
+        catalog = [
+            TemplateRecord(
+                logical_name_full=name,
+                relative_path=pathlib.Path(f"{name}.j2"),
+                absolute_path=tmp_path / f"{name}.j2",
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            )
+            for name in ("email/summary", "main")
+        ]
+        env = create_jinja_env_from_catalog(catalog)
+
+        assert env.get_template("main").render(name="A") == "[A][A]"
+        assert sorted(name for _loader, name in env.cache) == ["email/summary.j2", "main.j2"]
+
     def test_loader_get_source_not_found(self):
         """Test that loader raises TemplateNotFound for missing templates."""
         catalog = []
@@ -575,3 +798,107 @@ class TestCreateJinjaEnvFromCatalog:
         # Should raise UndefinedError for missing variable
         with pytest.raises(jinja2.UndefinedError):
             template.render()
+
+    def test_get_environment_reuses_env_for_equal_catalogs(self, tmp_path):
+        """Test that get_environment memoizes on catalog contents, not identity."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "test.j2").write_text("Test")
+        (template_dir / "other.j2").write_text("Other")
+
+        def make_record(name):
+            return TemplateRecord(
+                logical_name_full=name,
+                relative_path=pathlib.Path(f"{name}.j2"),
+                absolute_path=template_dir / f"{name}.j2",
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            )
+
+        env = get_environment([make_record("test")])
+
+        assert get_environment([make_record("test")]) is env
+        assert get_environment([make_record("test"), make_record("other")]) is not env
+        assert env.get_template("test") is env.get_template("test")
+
+    def test_catalog_environments_share_bytecode_cache(self, tmp_path):
+        """Test that a fresh environment loads compiled code stored by an earlier one."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "test.j2").write_text("Hello {{ name }}")
+        catalog = [
+            TemplateRecord(
+                logical_name_full="test",
+                relative_path=pathlib.Path("test.j2"),
+                absolute_path=template_dir / "test.j2",
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            )
+        ]
+
+        first = create_jinja_env_from_catalog(catalog)
+        assert first.bytecode_cache is not None
+        assert first.get_template("test").render(name="A") == "Hello A"
+
+        second = create_jinja_env_from_catalog(catalog)
+        bucket = second.bytecode_cache.get_bucket(second, "test.j2", str(template_dir / "test.j2"), "Hello {{ name }}")
+        assert bucket.code is not None
+        assert second.get_template("test").render(name="B") == "Hello B"
+
+    def test_bytecode_cache_directory_created_on_first_store(self, tmp_path):
+        """Test that the bytecode cache directory only appears once a template is compiled."""
+        (tmp_path / "test.j2").write_text("Hello {{ name }}")
+        cache_dir = tmp_path / "cache" / "jinja"
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(tmp_path)), bytecode_cache=_LazyBytecodeCache(str(cache_dir))
+        )
+
+        env.parse("{{ name }}")
+        assert not cache_dir.exists()
+
+        assert env.get_template("test.j2").render(name="A") == "Hello A"
+        assert any(cache_dir.iterdir())
+
+    def test_bytecode_cache_keyed_on_environment_settings(self):
+        """Test that environments compiling templates differently use separate cache directories."""
+        env = create_jinja_env_from_catalog([])
+        other = create_jinja_env_from_catalog([])
+        other.trim_blocks = False
+
+        assert _environment_fingerprint(env) == _environment_fingerprint(create_jinja_env_from_catalog([]))
+        assert _environment_fingerprint(env) != _environment_fingerprint(other)
+        assert env.bytecode_cache.directory.endswith(_environment_fingerprint(env))
+
+    def test_bytecode_cache_can_be_disabled(self, monkeypatch):
+        """Test that GAI_NO_BYTECODE_CACHE keeps compiled templates off disk."""
+        monkeypatch.setenv("GAI_NO_BYTECODE_CACHE", "1")
+
+        assert create_jinja_env_from_catalog([]).bytecode_cache is None
+
+    def test_get_environment_picks_up_template_edits(self, tmp_path):
+        """Test that a shared environment re-reads a template edited after its first render."""
+        template_file = tmp_path / "edited.j2"
+        template_file.write_text("Before {{ name }}")
+        catalog = [
+            TemplateRecord(
+                logical_name_full="edited",
+                relative_path=pathlib.Path("edited.j2"),
+                absolute_path=template_file,
+                tier="project",
+                root_index=0,
+                extension=".j2",
+            )
+        ]
+
+        assert get_environment(catalog).get_template("edited").render(name="A") == "Before A"
+        template_file.write_text("After {{ name }}")
+        os.utime(template_file, ns=(0, 0))
+
+        assert get_environment(catalog).get_template("edited").render(name="A") == "After A"
+
+    def test_catalog_environment_reload_can_be_disabled(self):
+        """Test that reload checks are on by default and can be turned off."""
+        assert create_jinja_env_from_catalog([]).auto_reload is True
+        assert create_jinja_env_from_catalog([], auto_reload=False).auto_reload is False